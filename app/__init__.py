@@ -1,32 +1,46 @@
 """TasksService API application factory."""
+import copy
 import os
 
-from flask import Flask
+from flask import Flask, current_app, jsonify
+from pydantic import ValidationError
+from werkzeug.exceptions import HTTPException
 
 from app.api import register_blueprints
-from app.core.config import get_settings
+from app.core.config import get_settings_mapping
 from app.core.extensions import register_extensions
+from app.utils.dates import register_request_date
+from app.utils.json import OrjsonProvider
 from app.utils.logging import configure_logging
 
 
-def create_app(config_name=None):
+def create_app(config_name=None, config_overrides=None):
     """
     Create Flask application with specified configurations.
 
     Args:
         config_name: Configuration environment name
+        config_overrides: Optional mapping applied over the loaded settings
 
     Returns:
         Flask application instance
     """
     app = Flask(__name__)
 
+    # Serialize JSON requests and responses with orjson
+    app.json = OrjsonProvider(app)
+
     # Determine environment
     env = config_name or os.getenv("FLASK_ENV", "development")
 
-    # Load configuration from pydantic settings
-    settings = get_settings(env)
-    app.config.from_mapping(settings.model_dump())
+    # Load configuration from pydantic settings, copying the nested dicts so
+    # apps never share them through the cached mapping
+    app.config.from_mapping(copy.deepcopy(get_settings_mapping(env)))
+    if config_overrides:
+        app.config.from_mapping(config_overrides)
+
+    # Match routes with and without a trailing slash without redirecting
+    app.url_map.strict_slashes = False
 
     # Configure logging
     configure_logging(app)
@@ -34,9 +48,34 @@ def create_app(config_name=None):
     # Configure extensions
     register_extensions(app)
 
+    # Cache today's date per request
+    register_request_date(app)
+
     # Register blueprints
     register_blueprints(app)
 
+    # Compile the URL matcher now rather than on the first request
+    app.url_map.update()
+
+    # Error handlers shared by all endpoints
+    @app.errorhandler(ValidationError)
+    def handle_validation_error(e):
+        """Return request validation errors as a 400 response."""
+        return (
+            jsonify({"status": "error", "message": e.errors(include_context=False)}),
+            400,
+        )
+
+    @app.errorhandler(Exception)
+    def handle_exception(e):
+        """Return unhandled errors as a 500 response, keeping HTTP errors as is."""
+        if isinstance(e, HTTPException):
+            return e
+
+        # The details stay in the log, clients never see exception text
+        current_app.logger.exception("Unhandled error")
+        return jsonify({"status": "error", "message": "Internal server error"}), 500
+
     # Shell context for Flask CLI
     @app.shell_context_processor
     def shell_context():
@@ -9,7 +9,7 @@ def register_blueprints(app):
         app: Flask application instance
     """
     # Import blueprints
-    from .v1 import api_v1_bp
+    from app.api.v1 import register_v1
 
     # Register blueprints
-    app.register_blueprint(api_v1_bp, url_prefix="/api/v1")
+    register_v1(app)
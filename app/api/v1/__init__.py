@@ -1,18 +1,65 @@
 """API v1 routes."""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from flask import Blueprint
 
-from .category import category_bp
-from .health import health_bp
-from .tag import tag_bp
-from .task import task_bp
-from .user import user_bp
+if TYPE_CHECKING:
+    from .category import category_bp
+    from .health import health_bp
+    from .tag import tag_bp
+    from .task import task_bp
+    from .user import user_bp
+
+# Nested blueprints and the submodules defining them, imported on first access
+_LAZY = {
+    "health_bp": ".health",
+    "user_bp": ".user",
+    "category_bp": ".category",
+    "task_bp": ".task",
+    "tag_bp": ".tag",
+}
+
+__all__ = [
+    "api_v1_bp",
+    "register_v1",
+    "health_bp",
+    "user_bp",
+    "category_bp",
+    "task_bp",
+    "tag_bp",
+]
 
 # Create v1 blueprint
 api_v1_bp = Blueprint("api_v1", __name__, url_prefix="/api/v1")
 
-# Register nested blueprints
-api_v1_bp.register_blueprint(health_bp)
-api_v1_bp.register_blueprint(user_bp)
-api_v1_bp.register_blueprint(category_bp)
-api_v1_bp.register_blueprint(task_bp)
-api_v1_bp.register_blueprint(tag_bp)
+
+def __getattr__(name):
+    """Import nested blueprint modules lazily on attribute access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_LAZY[name], __name__)
+    blueprint = getattr(module, name)
+    globals()[name] = blueprint
+    return blueprint
+
+
+def register_v1(app):
+    """
+    Register nested blueprints and the v1 blueprint.
+
+    Args:
+        app: Flask application instance
+    """
+    # Register nested blueprints
+    if not api_v1_bp._blueprints:
+        for name in _LAZY:
+            api_v1_bp.register_blueprint(__getattr__(name))
+
+    # Guard against nested blueprints being registered twice
+    names = [blueprint.name for blueprint, _ in api_v1_bp._blueprints]
+    if len(names) != len(set(names)):
+        raise RuntimeError(f"Duplicate nested blueprints on api_v1: {names}")
+
+    app.register_blueprint(api_v1_bp, url_prefix="/api/v1")
@@ -4,39 +4,88 @@ from functools import wraps
 from flask import abort, g, request
 
 from app.schemas.user import RoleEnum
-from app.services.auth import get_current_user_from_token
+from app.services.auth import get_current_user_id_from_token
+from app.services.user import get_user_by_id, user_exists
 
+ADMIN_ROLE = RoleEnum.ADMIN
 
-def get_token_from_header():
-    """Extract token from the Authorization header."""
+
+def _require_user_id():
+    """
+    Authenticate the request token and store the user ID in flask.g.
+
+    The user is not loaded, only its ID is looked up so tokens of deleted
+    users are rejected.
+
+    Returns:
+        The authenticated user ID
+
+    Raises:
+        HTTPException: 401 if the token is missing or invalid
+    """
+    # Extract token from the Authorization header
     auth_header = request.headers.get("Authorization", "")
-    if not auth_header.startswith("Bearer "):
-        return None
+    token = auth_header[7:] if auth_header.startswith("Bearer ") else None
+    if not token:
+        abort(401, "Authentication token required")
 
-    return auth_header.split(" ")[1]
+    # Reuse the identity already resolved for this token during the request
+    if getattr(g, "_auth_token", None) == token:
+        return g.current_user_id
 
+    user_id = get_current_user_id_from_token(token)
+    if not user_id or not user_exists(user_id):
+        abort(401, "Invalid authentication token")
 
-def login_required(f):
-    """Check if the user is logged in."""
+    # Set the current user ID in flask.g for access in route handlers
+    g.current_user_id = user_id
+    g._auth_token = token
+
+    return user_id
+
+
+def _require_user():
+    """
+    Authenticate the request and store the user in flask.g.
+
+    Returns:
+        The authenticated user
+
+    Raises:
+        HTTPException: 401 if the token is missing or invalid
+    """
+    user_id = _require_user_id()
+
+    user = getattr(g, "current_user", None)
+    if user is None:
+        user = get_user_by_id(user_id)
+        if not user:
+            abort(401, "Invalid authentication token")
+
+        # Set the current user in flask.g for access in route handlers
+        g.current_user = user
+
+    return user
+
+
+def user_id_required(f):
+    """Check if the request carries a valid token of an existing user."""
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        token = get_token_from_header()
-        if not token:
-            abort(401, "Authentication token required")
+        _require_user_id()
+        return f(*args, **kwargs)
+
+    return decorated_function
 
-        try:
-            user = get_current_user_from_token(token)
-            if not user:
-                abort(401, "Invalid authentication token")
 
-            # Set the current user in flask.g for access in route handlers
-            g.current_user = user
-            g.current_user_id = user.id
+def login_required(f):
+    """Check if the user is logged in."""
 
-            return f(*args, **kwargs)
-        except Exception as e:
-            abort(401, f"Authentication error: {str(e)}")
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        _require_user()
+        return f(*args, **kwargs)
 
     return decorated_function
 
@@ -46,11 +95,8 @@ def admin_required(f):
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        # First check if user is logged in
-        login_required(lambda: None)()
-
-        # Then check if user is admin
-        if g.current_user.role != RoleEnum.ADMIN:
+        user = _require_user()
+        if user.role is not ADMIN_ROLE:
             abort(403, "Admin access required")
 
         return f(*args, **kwargs)
@@ -1,7 +1,9 @@
 """Category API endpoints."""
+from uuid import UUID
+
 from flask import Blueprint, g, jsonify, request
-from pydantic import ValidationError
 
+from app.schemas import PageParams
 from app.schemas.category import CategoryCreate, CategoryUpdate
 from app.services.category import (
     create_category,
@@ -11,144 +13,109 @@ from app.services.category import (
     list_categories,
     update_category,
 )
+from app.utils.responses import paginated
 
-from .auth_decorators import login_required
+from .auth_decorators import user_id_required
 
 category_bp = Blueprint("categories", __name__, url_prefix="/")
 
 
 @category_bp.route("", methods=["POST"])
-@login_required
+@user_id_required
 def create_new_category():
     """Create a new category."""
-    data = request.get_json()
+    data = request.get_json(silent=True, cache=False)
     if not data:
         return jsonify({"status": "error", "message": "Invalid JSON body"}), 400
 
-    try:
-        category_data = CategoryCreate(**data)
-    except ValidationError as e:
-        return jsonify({"status": "error", "message": e.errors()}), 400
-
-    try:
-        category = create_category(
-            user_id=g.current_user_id,
-            name=category_data.name,
-            description=category_data.description,
-        )
-
-        return (
-            jsonify(
-                {
-                    "status": "success",
-                    "message": "Category created successfully",
-                    "data": category.to_dict(),
-                }
-            ),
-            201,
-        )
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    category_data = CategoryCreate.model_validate(data)
+
+    category = create_category(
+        user_id=g.current_user_id,
+        name=category_data.name,
+        description=category_data.description,
+    )
+
+    return (
+        jsonify(
+            {
+                "status": "success",
+                "message": "Category created successfully",
+                "data": category.to_json_dict(),
+            }
+        ),
+        201,
+    )
 
 
 @category_bp.route("", methods=["GET"])
-@login_required
+@user_id_required
 def get_categories():
     """List all categories for the current user."""
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 20, type=int)
+    params = PageParams.model_validate(request.args.to_dict())
     sort_by = request.args.get("sort_by", "name")
     sort_order = request.args.get("sort_order", "asc")
 
-    try:
-        categories, total = list_categories(
-            user_id=g.current_user_id,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            page=page,
-            per_page=per_page,
-        )
+    categories, total = list_categories(
+        user_id=g.current_user_id,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        page=params.page,
+        per_page=params.per_page,
+    )
 
-        return jsonify(
-            {
-                "status": "success",
-                "data": [category.to_dict() for category in categories],
-                "page": page,
-                "per_page": per_page,
-                "total": total,
-                "pages": (total + per_page - 1) // per_page,
-            }
-        )
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    return paginated(categories, params.page, params.per_page, total)
 
 
 @category_bp.route("/stats", methods=["GET"])
-@login_required
+@user_id_required
 def get_categories_stats():
     """Get statistics for all categories."""
-    try:
-        stats = get_category_stats(g.current_user_id)
-        return jsonify({"status": "success", "data": stats})
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    stats = get_category_stats(g.current_user_id)
+    return jsonify({"status": "success", "data": stats})
 
 
 @category_bp.route("/<uuid:category_id>", methods=["GET"])
-@login_required
-def get_category(category_id):
+@user_id_required
+def get_category(category_id: UUID):
     """Get a specific category by ID."""
     category = get_category_by_id(category_id, g.current_user_id)
     if not category:
         return jsonify({"status": "error", "message": "Category not found"}), 404
 
-    return jsonify({"status": "success", "data": category.to_dict()})
+    return jsonify({"status": "success", "data": category.to_json_dict()})
 
 
 @category_bp.route("/<uuid:category_id>", methods=["PUT"])
-@login_required
-def update_category_by_id(category_id):
+@user_id_required
+def update_category_by_id(category_id: UUID):
     """Update a specific category by ID."""
-    category = get_category_by_id(category_id, g.current_user_id)
-    if not category:
-        return jsonify({"status": "error", "message": "Category not found"}), 404
-
-    data = request.get_json()
+    data = request.get_json(silent=True, cache=False)
     if not data:
         return jsonify({"status": "error", "message": "Invalid JSON body"}), 400
 
-    try:
-        category_data = CategoryUpdate(**data)
-    except ValidationError as e:
-        return jsonify({"status": "error", "message": e.errors()}), 400
+    category_data = CategoryUpdate.model_validate(data)
 
-    try:
-        updated_category = update_category(
-            category, category_data.dict(exclude_unset=True)
-        )
-        return jsonify(
-            {
-                "status": "success",
-                "message": "Category updated successfully",
-                "data": updated_category.to_dict(),
-            }
-        )
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    updated_category = update_category(
+        category_id, g.current_user_id, category_data.model_dump(exclude_unset=True)
+    )
+    if not updated_category:
+        return jsonify({"status": "error", "message": "Category not found"}), 404
+
+    return jsonify(
+        {
+            "status": "success",
+            "message": "Category updated successfully",
+            "data": updated_category.to_json_dict(),
+        }
+    )
 
 
 @category_bp.route("/<uuid:category_id>", methods=["DELETE"])
-@login_required
-def delete_category_by_id(category_id):
+@user_id_required
+def delete_category_by_id(category_id: UUID):
     """Delete a specific category by ID."""
-    category = get_category_by_id(category_id, g.current_user_id)
-    if not category:
+    if not delete_category(category_id, g.current_user_id):
         return jsonify({"status": "error", "message": "Category not found"}), 404
 
-    try:
-        delete_category(category)
-        return jsonify(
-            {"status": "success", "message": "Category deleted successfully"}
-        )
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    return jsonify({"status": "success", "message": "Category deleted successfully"})
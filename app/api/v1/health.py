@@ -1,4 +1,6 @@
 """Health check endpoint for the TasksService API."""
+import time
+
 from flask import Blueprint, current_app, jsonify
 from sqlalchemy import text
 
@@ -6,6 +8,20 @@ from app.core.extensions import db
 
 health_bp = Blueprint("health", __name__, url_prefix="/")
 
+# Last database probe result, reused for HEALTH_CHECK_TTL seconds
+_db_status = {"ok": False, "checked_at": None}
+
+
+def _probe_db() -> bool:
+    """Check that the database accepts queries."""
+    try:
+        db.session.execute(text("SELECT 1"))
+        current_app.logger.info("DB connection successful")
+        return True
+    except Exception:
+        current_app.logger.exception("DB connection error")
+        return False
+
 
 @health_bp.get("/health")
 def health_check():
@@ -33,12 +49,12 @@ def health_check():
                   type: boolean
                   example: true
     """
-    db_connection = False
-    try:
-        db.session.execute(text("SELECT 1"))
-        db_connection = True
-        current_app.logger.info("DB connection successful")
-    except Exception as e:
-        current_app.logger.error("DB connection error:", e)
+    now = time.monotonic()
+    checked_at = _db_status["checked_at"]
+    if checked_at is None or now - checked_at >= current_app.config["HEALTH_CHECK_TTL"]:
+        _db_status["ok"] = _probe_db()
+        _db_status["checked_at"] = now
 
-    return jsonify({"status": "ok", "version": "0.1.0", "db_connection": db_connection})
+    return jsonify(
+        {"status": "ok", "version": "0.1.0", "db_connection": _db_status["ok"]}
+    )
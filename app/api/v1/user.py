@@ -1,8 +1,10 @@
 """User API endpoints."""
 from os import getenv
+from uuid import UUID
 
 from flask import Blueprint, g, jsonify, request
 
+from app.schemas import PageParams
 from app.schemas.user import TokenResponse, UserCreate, UserLogin, UserUpdate
 from app.services.auth import authenticate_user, create_access_token, register_user
 from app.services.user import (
@@ -11,8 +13,10 @@ from app.services.user import (
     get_user_by_id,
     get_user_by_username,
     list_users,
+    list_users_by_cursor,
     update_user,
 )
+from app.utils.responses import cursor_paginated, paginated
 
 from .auth_decorators import admin_required, login_required
 
@@ -24,14 +28,11 @@ TOKEN_TYPE = getenv("TOKEN_TYPE", "bearer")
 @user_bp.route("/register", methods=["POST"])
 def register():
     """Register a new user."""
-    data = request.json
+    data = request.get_json(silent=True, cache=False)
     if not data:
         return jsonify({"status": "error", "message": "Missing JSON payload"}), 400
 
-    try:
-        user_data = UserCreate(**data)
-    except ValueError as e:
-        return jsonify({"status": "error", "message": f"Invalid input: {str(e)}"}), 400
+    user_data = UserCreate.model_validate(data)
 
     if get_user_by_username(user_data.username) or get_user_by_email(user_data.email):
         return (
@@ -39,41 +40,35 @@ def register():
             409,
         )
 
-    try:
-        user, _ = register_user(
-            username=user_data.username,
-            email=user_data.email,
-            password=user_data.password,
-        )
-        token = create_access_token(user.id)
+    user, _ = register_user(
+        username=user_data.username,
+        email=user_data.email,
+        password=user_data.password,
+    )
+    token = create_access_token(user.id)
 
-        return (
-            jsonify(
-                {
-                    "status": "success",
-                    "message": "User registered successfully",
-                    "data": TokenResponse(
-                        access_token=token, token_type=TOKEN_TYPE, expires_in=3600
-                    ).model_dump(),
-                }
-            ),
-            201,
-        )
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    return (
+        jsonify(
+            {
+                "status": "success",
+                "message": "User registered successfully",
+                "data": TokenResponse(
+                    access_token=token, token_type=TOKEN_TYPE, expires_in=3600
+                ).model_dump(),
+            }
+        ),
+        201,
+    )
 
 
 @user_bp.route("/login", methods=["POST"])
 def login():
     """Authenticate a user and return a token."""
-    data = request.json
+    data = request.get_json(silent=True, cache=False)
     if not data:
         return jsonify({"status": "error", "message": "Missing JSON payload"}), 400
 
-    try:
-        user_data = UserLogin(**data)
-    except ValueError as e:
-        return jsonify({"status": "error", "message": f"Invalid input: {str(e)}"}), 400
+    user_data = UserLogin.model_validate(data)
 
     user = authenticate_user(user_data.username, user_data.password)
     if not user:
@@ -87,7 +82,7 @@ def login():
             "message": "Login successful",
             "data": TokenResponse(
                 access_token=token, token_type=TOKEN_TYPE, expires_in=3600
-            ).dict(),
+            ).model_dump(),
         }
     )
 
@@ -96,85 +91,70 @@ def login():
 @login_required
 def get_current_user():
     """Get the current authenticated user."""
-    return jsonify({"status": "success", "data": g.current_user.to_dict()})
+    return jsonify({"status": "success", "data": g.current_user.to_json_dict()})
 
 
 @user_bp.route("/me", methods=["PUT"])
 @login_required
 def update_current_user():
     """Update the current authenticated user."""
-    data = request.json
+    data = request.get_json(silent=True, cache=False)
     if not data:
         return jsonify({"status": "error", "message": "Missing JSON payload"}), 400
 
-    try:
-        user_data = UserUpdate(**data)
-    except ValueError as e:
-        return jsonify({"status": "error", "message": f"Invalid input: {str(e)}"}), 400
+    user_data = UserUpdate.model_validate(data)
 
-    try:
-        updated_user = update_user(g.current_user, user_data.dict(exclude_unset=True))
-        return jsonify(
-            {
-                "status": "success",
-                "message": "User updated successfully",
-                "data": updated_user.to_dict(),
-            }
-        )
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    updated_user = update_user(g.current_user, user_data.model_dump(exclude_unset=True))
+    return jsonify(
+        {
+            "status": "success",
+            "message": "User updated successfully",
+            "data": updated_user.to_json_dict(),
+        }
+    )
 
 
 @user_bp.route("/me", methods=["DELETE"])
 @login_required
 def delete_current_user():
     """Delete the current authenticated user."""
-    try:
-        delete_user(g.current_user)
-        return jsonify({"status": "success", "message": "User deleted successfully"})
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    delete_user(g.current_user)
+    return jsonify({"status": "success", "message": "User deleted successfully"})
 
 
 @user_bp.route("", methods=["GET"])
 @admin_required
 def get_users():
     """List all users (admin only)."""
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 20, type=int)
+    params = PageParams.model_validate(request.args.to_dict())
 
-    try:
-        users, total = list_users(page=page, per_page=per_page)
-        return jsonify(
-            {
-                "status": "success",
-                "data": [user.to_dict() for user in users],
-                "page": page,
-                "per_page": per_page,
-                "total": total,
-                "pages": (total + per_page - 1) // per_page,
-            }
+    # Any cursor parameter, even empty, switches to cursor pagination
+    if params.cursor is not None:
+        users, next_cursor = list_users_by_cursor(
+            cursor=params.cursor, per_page=params.per_page
         )
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+        return cursor_paginated(users, params.per_page, next_cursor)
+
+    users, total = list_users(page=params.page, per_page=params.per_page)
+    return paginated(users, params.page, params.per_page, total)
 
 
 @user_bp.route("/<uuid:user_id>", methods=["GET"])
 @admin_required
-def get_user(user_id):
+def get_user(user_id: UUID):
     """Get a specific user by ID (admin only)."""
     user = get_user_by_id(user_id)
     if not user:
         return jsonify({"status": "error", "message": "User not found"}), 404
 
-    return jsonify({"status": "success", "data": user.to_dict()})
+    return jsonify({"status": "success", "data": user.to_json_dict()})
 
 
 @user_bp.route("/<uuid:user_id>", methods=["PUT"])
 @admin_required
-def update_user_by_id(user_id):
+def update_user_by_id(user_id: UUID):
     """Update a specific user by ID (admin only)."""
-    data = request.json
+    data = request.get_json(silent=True, cache=False)
     if not data:
         return jsonify({"status": "error", "message": "Missing JSON payload"}), 400
 
@@ -182,34 +162,25 @@ def update_user_by_id(user_id):
     if not user:
         return jsonify({"status": "error", "message": "User not found"}), 404
 
-    try:
-        user_data = UserUpdate(**data)
-    except ValueError as e:
-        return jsonify({"status": "error", "message": f"Invalid input: {str(e)}"}), 400
+    user_data = UserUpdate.model_validate(data)
 
-    try:
-        updated_user = update_user(user, user_data.dict(exclude_unset=True))
-        return jsonify(
-            {
-                "status": "success",
-                "message": "User updated successfully",
-                "data": updated_user.to_dict(),
-            }
-        )
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    updated_user = update_user(user, user_data.model_dump(exclude_unset=True))
+    return jsonify(
+        {
+            "status": "success",
+            "message": "User updated successfully",
+            "data": updated_user.to_json_dict(),
+        }
+    )
 
 
 @user_bp.route("/<uuid:user_id>", methods=["DELETE"])
 @admin_required
-def delete_user_by_id(user_id):
+def delete_user_by_id(user_id: UUID):
     """Delete a specific user by ID (admin only)."""
     user = get_user_by_id(user_id)
     if not user:
         return jsonify({"status": "error", "message": "User not found"}), 404
 
-    try:
-        delete_user(user)
-        return jsonify({"status": "success", "message": "User deleted successfully"})
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+    delete_user(user)
+    return jsonify({"status": "success", "message": "User deleted successfully"})
@@ -1,4 +1,4 @@
 """Core module initialization."""
-from .config import get_settings
+from .config import get_settings, get_settings_mapping
 
-__all__ = ["get_settings"]
+__all__ = ["get_settings", "get_settings_mapping"]
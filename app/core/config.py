@@ -1,8 +1,14 @@
 """Configuration settings for the TasksService API using pydantic-settings."""
-from typing import List
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Tuple, Type
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    NoDecode,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 
 class Settings(BaseSettings):
@@ -28,6 +34,12 @@ class Settings(BaseSettings):
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = Field(
         default=False, description="SQLAlchemy track modifications", examples=[False]
     )
+    SQLALCHEMY_ENGINE_OPTIONS: dict = Field(
+        # Check connections on checkout and retire them before server side timeouts
+        default={"pool_pre_ping": True, "pool_recycle": 300},
+        description="SQLAlchemy engine options",
+        examples=[{"pool_pre_ping": True, "pool_recycle": 300}],
+    )
 
     # JWT
     JWT_SECRET_KEY: str = Field(
@@ -42,24 +54,33 @@ class Settings(BaseSettings):
         examples=[43200],
     )
 
+    # Password hashing
+    BCRYPT_ROUNDS: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt work factor, each extra round doubles the hashing time",
+        examples=[12],
+    )
+
     # Logging
     LOG_LEVEL: str = Field(
         default="INFO", description="Logging level", examples=["INFO"]
     )
 
     # CORS
-    CORS_ORIGINS: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"],
+    CORS_ORIGINS: Annotated[Tuple[str, ...], NoDecode] = Field(
+        default=("http://localhost:3000", "http://localhost:8080"),
         description="CORS origins",
         examples=["http://localhost:3000", "http://localhost:8080"],
     )
 
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
-    def assemble_cors_origins(cls, v) -> List[str]:
-        """Assemble CORS origins."""
+    def assemble_cors_origins(cls, v) -> Tuple[str, ...]:
+        """Assemble CORS origins from a comma separated string."""
         if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
+            return tuple(i.strip() for i in v.split(","))
         return v
 
     # Rate limiting
@@ -75,6 +96,13 @@ class Settings(BaseSettings):
         default=False, description="Enable rate limiting", examples=[False]
     )
 
+    # Health check
+    HEALTH_CHECK_TTL: float = Field(
+        default=5.0,
+        description="Seconds to reuse the health check database probe result",
+        examples=[5.0],
+    )
+
     # Swagger
     SWAGGER: dict = Field(
         default={"title": "Tasks Service API", "uiversion": 3, "version": "0.1.0"},
@@ -82,10 +110,27 @@ class Settings(BaseSettings):
         examples=[{"title": "Tasks Service API", "uiversion": 3, "version": "0.1.0"}],
     )
 
+    # Frozen so the cached instance can be shared safely across threads
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Read settings from init kwargs, the environment and the .env file only."""
+        return init_settings, env_settings, dotenv_settings
+
 
 class TestingSettings(Settings):
     """Testing configuration."""
@@ -103,12 +148,31 @@ class TestingSettings(Settings):
         description="JWT access token expiration time in seconds",
         examples=[3600],
     )
+    BCRYPT_ROUNDS: int = Field(
+        # bcrypt's minimum, hashing strength does not matter in tests
+        default=4,
+        ge=4,
+        le=31,
+        description="bcrypt work factor, each extra round doubles the hashing time",
+        examples=[4],
+    )
+    SQLALCHEMY_ENGINE_OPTIONS: dict = Field(
+        # The in-memory database lives on a single static connection
+        default={},
+        description="SQLAlchemy engine options",
+        examples=[{}],
+    )
     PRESERVE_CONTEXT_ON_EXCEPTION: bool = Field(
         default=False, description="Preserve context on exception", examples=[False]
     )
     RATELIMIT_ENABLED: bool = Field(
         default=False, description="Enable rate limiting", examples=[False]
     )
+    HEALTH_CHECK_TTL: float = Field(
+        default=0.0,
+        description="Seconds to reuse the health check database probe result",
+        examples=[0.0],
+    )
 
 
 class DevelopmentSettings(Settings):
@@ -126,6 +190,19 @@ class ProductionSettings(Settings):
         default=True, description="Enable rate limiting", examples=[True]
     )
 
+    SQLALCHEMY_ENGINE_OPTIONS: dict = Field(
+        # Sized for gevent workers, where many requests share one process pool
+        default={
+            "pool_pre_ping": True,
+            "pool_recycle": 300,
+            "pool_size": 10,
+            "max_overflow": 20,
+            "pool_timeout": 10,
+        },
+        description="SQLAlchemy engine options",
+        examples=[{"pool_pre_ping": True, "pool_recycle": 300, "pool_size": 10}],
+    )
+
     # Security
     SESSION_COOKIE_SECURE: bool = Field(
         default=True, description="Session cookie secure", examples=[True]
@@ -143,6 +220,17 @@ config_by_name = {
 }
 
 
+@lru_cache(maxsize=8)
 def get_settings(env: str = "development") -> Settings:
     """Get settings for the current environment."""
     return config_by_name.get(env, DevelopmentSettings)()
+
+
+@lru_cache(maxsize=8)
+def get_settings_mapping(env: str = "development") -> Dict[str, Any]:
+    """
+    Get settings for the current environment as a flat config mapping.
+
+    The mapping is cached and shared, copy it before changing any value.
+    """
+    return get_settings(env).model_dump()
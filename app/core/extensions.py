@@ -1,18 +1,61 @@
 """Flask extensions initialization."""
+from functools import lru_cache
+
 from flasgger import Swagger
+from flask import request
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
+
+def _remote_addr_key():
+    """Rate limit key read straight from the WSGI environ."""
+    return request.environ.get("REMOTE_ADDR") or "127.0.0.1"
+
+
 # Instantiate extensions
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
 cors = CORS()
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=_remote_addr_key)
+
+API_V1_PREFIX = "/api/v1"
+
+
+def _rule_filter(rule):
+    """Include only v1 API rules in the Swagger spec."""
+    return rule.rule.startswith(API_V1_PREFIX)
+
+
+def _model_filter(tag):
+    """Include every model in the Swagger spec."""
+    return True
+
+
+@lru_cache(maxsize=8)
+def _cors_resources(origins):
+    """Build the CORS resources mapping once per set of origins."""
+    return {r"/api/*": {"origins": list(origins)}}
+
+
+# Swagger UI configuration, shared by every app instance
+SWAGGER_CONFIG = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": "apispec_1",
+            "route": f"{API_V1_PREFIX}/apispec_1.json",
+            "rule_filter": _rule_filter,
+            "model_filter": _model_filter,
+        }
+    ],
+    "static_url_path": "/flasgger_static",
+    "swagger_ui": True,
+    "specs_route": f"{API_V1_PREFIX}/apidocs/",
+}
 
 
 def register_extensions(app):
@@ -25,34 +68,20 @@ def register_extensions(app):
     # Initialize SQLAlchemy
     db.init_app(app)
 
-    # Initialize Migrations
-    migrate.init_app(app, db)
+    # Initialize Migrations, tests build their schema with db.create_all()
+    if not app.config.get("TESTING"):
+        migrate.init_app(app, db)
 
     # Initialize JWT
     jwt.init_app(app)
 
     # Initialize CORS
-    cors.init_app(app, resources={r"/api/*": {"origins": app.config["CORS_ORIGINS"]}})
+    cors.init_app(app, resources=_cors_resources(tuple(app.config["CORS_ORIGINS"])))
 
     # Initialize Rate Limiter
     limiter.init_app(app)
 
-    # Initialize Swagger UI
-    swagger_config = {
-        "headers": [],
-        "specs": [
-            {
-                "endpoint": "apispec_1",
-                "route": "/api/v1/apispec_1.json",
-                "rule_filter": lambda rule: rule.rule.startswith("/api/v1"),
-                "model_filter": lambda tag: True,
-            }
-        ],
-        "static_url_path": "/flasgger_static",
-        "swagger_ui": True,
-        "specs_route": "/api/v1/apidocs/",
-    }
-
-    Swagger(app, config=swagger_config)
+    # Initialize Swagger UI, copying the config since Flasgger updates it in place
+    Swagger(app, config=dict(SWAGGER_CONFIG))
 
     return None
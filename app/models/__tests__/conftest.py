@@ -1,10 +1,14 @@
 """Test configuration for pytest."""
 import warnings
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from os import environ
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
 
+from app import create_app
+from app.core.config import get_settings, get_settings_mapping
 from app.core.extensions import db
 from app.models.category import Category
 from app.models.tag import Tag
@@ -12,40 +16,54 @@ from app.models.task import Task, TaskTag
 from app.models.user import User
 from app.schemas.task import PriorityEnum, StatusEnum
 from app.schemas.user import RoleEnum
+from app.utils.security import hash_password
+from app.utils.sqlite import enable_savepoints
 
+TODAY = datetime.now().date()
 
-def pytest_configure(config):
-    """Configure warnings to ignore DeprecationWarnings for specific modules."""
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, module="sqlalchemy.*"
-    )
-    warnings.filterwarnings("ignore", category=DeprecationWarning, module="werkzeug.*")
-    warnings.filterwarnings("ignore", category=DeprecationWarning, module="ast")
-    warnings.filterwarnings(
-        "ignore", message=".*PydanticDeprecatedSince20.*", module="pydantic.*"
-    )
-    warnings.filterwarnings(
-        "ignore", category=Warning, message=".*declarative base already contains.*"
-    )
+# Hash fixture passwords once instead of running bcrypt for every test
+BCRYPT_ROUNDS = get_settings("testing").BCRYPT_ROUNDS
+USER_PASSWORD_HASH = hash_password("password123", rounds=BCRYPT_ROUNDS)
+ADMIN_PASSWORD_HASH = hash_password("admin123", rounds=BCRYPT_ROUNDS)
 
+# Ignore known third-party deprecation noise, installed once at import
+warnings.filterwarnings(
+    "ignore", category=DeprecationWarning, module=r"sqlalchemy.*|werkzeug.*|ast"
+)
+warnings.filterwarnings(
+    "ignore", message=".*PydanticDeprecatedSince20.*", module="pydantic.*"
+)
+warnings.filterwarnings(
+    "ignore", category=Warning, message=".*declarative base already contains.*"
+)
 
-@pytest.fixture(scope="function")
-def app():
-    """Configure the app to use SQLite in-memory database."""
-    from app import create_app
 
-    environ["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
-    environ["TESTING"] = "True"
+def persist(session, *objs):
+    """Add objects to the session and flush them in a single batch."""
+    session.add_all(objs)
+    session.flush()
+    return objs
 
-    app = create_app("testing")
 
-    # Configure the app to use SQLite in-memory database
-    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+@pytest.fixture(scope="session")
+def app():
+    """Configure the app to use SQLite in-memory database.
 
-    from app.core.extensions import db
+    The app and its schema are created once for the whole test session.
+    """
+    # Rebuild the cached settings from the current environment
+    get_settings.cache_clear()
+    get_settings_mapping.cache_clear()
+
+    # Flask-SQLAlchemy serves in-memory SQLite through a StaticPool, so every
+    # connection shares the database created below
+    app = create_app(
+        "testing", {"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:", "TESTING": True}
+    )
 
     with app.app_context():
+        enable_savepoints(db.engine)
+
         # Create tables
         db.create_all()
         yield app
@@ -54,24 +72,67 @@ def app():
         db.drop_all()
 
 
+@pytest.fixture(scope="session")
+def connection(app):
+    """Open one connection and outer transaction shared by the whole test session.
+
+    Nothing written during the session is ever committed to the database.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+
+    yield connection
+
+    transaction.rollback()
+    connection.close()
+
+
 @pytest.fixture(scope="function")
-def db_session(app):
+def db_session(connection):
     """Create and manage a database session for testing.
 
-    This fixture provides a fresh database session for each test
-    and rolls back transactions to ensure isolation.
+    Each test runs inside its own SAVEPOINT on the shared connection, rolled back
+    afterwards to ensure isolation. Commits inside the test only release a nested
+    SAVEPOINT and keep loaded attributes.
     """
-    with app.app_context():
-        connection = db.engine.connect()
-        transaction = connection.begin()
+    savepoint = connection.begin_nested()
+
+    session = scoped_session(
+        sessionmaker(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+    )
+    app_session, db.session = db.session, session
+
+    yield session
 
-        session = db.session
+    session.remove()
+    db.session = app_session
+    if savepoint.is_active:
+        savepoint.rollback()
 
-        yield session
 
-        transaction.rollback()
-        connection.close()
-        session.remove()
+@pytest.fixture
+def count_queries(db_session):
+    """Return a context manager collecting the SQL statements run inside it."""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        connection = db_session.connection()
+        event.listen(connection, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+    return counter
 
 
 @pytest.fixture
@@ -81,9 +142,10 @@ def user(db_session):
     This fixture creates a test user with default values and adds it to the database.
     The user is returned for use in test functions.
     """
-    user = User(username="testuser", email="test@example.com", password="password123")
-    db_session.add(user)
-    db_session.commit()
+    user = User(
+        username="testuser", email="test@example.com", password_hash=USER_PASSWORD_HASH
+    )
+    persist(db_session, user)
     return user
 
 
@@ -97,11 +159,10 @@ def admin_user(db_session):
     admin = User(
         username="adminuser",
         email="admin@example.com",
-        password="admin123",
+        password_hash=ADMIN_PASSWORD_HASH,
         role=RoleEnum.ADMIN,
     )
-    db_session.add(admin)
-    db_session.commit()
+    persist(db_session, admin)
     return admin
 
 
@@ -115,8 +176,7 @@ def category(db_session, user):
     category = Category(
         name="Test Category", description="Test category description", user_id=user.id
     )
-    db_session.add(category)
-    db_session.commit()
+    persist(db_session, category)
     return category
 
 
@@ -128,8 +188,7 @@ def tag(db_session, user):
     and adds it to the database. The tag is returned for use in test functions.
     """
     tag = Tag(name="TestTag", user_id=user.id)
-    db_session.add(tag)
-    db_session.commit()
+    persist(db_session, tag)
     return tag
 
 
@@ -141,12 +200,11 @@ def task(db_session, user, category):
         description="Test task description",
         status=StatusEnum.TODO,
         priority=PriorityEnum.MEDIUM,
-        due_date=datetime.now().date() + timedelta(days=1),
+        due_date=TODAY + timedelta(days=1),
         user_id=user.id,
         category_id=category.id,
     )
-    db_session.add(task)
-    db_session.commit()
+    persist(db_session, task)
     return task
 
 
@@ -158,12 +216,11 @@ def overdue_task(db_session, user, category):
         description="This task is overdue",
         status=StatusEnum.TODO,
         priority=PriorityEnum.HIGH,
-        due_date=datetime.now().date() - timedelta(days=1),
+        due_date=TODAY - timedelta(days=1),
         user_id=user.id,
         category_id=category.id,
     )
-    db_session.add(task)
-    db_session.commit()
+    persist(db_session, task)
     return task
 
 
@@ -171,6 +228,5 @@ def overdue_task(db_session, user, category):
 def task_with_tags(db_session, task, tag):
     """Create a task and associate it with a tag."""
     task_tag = TaskTag(task_id=task.id, tag_id=tag.id)
-    db_session.add(task_tag)
-    db_session.commit()
+    persist(db_session, task_tag)
     return task
@@ -1,8 +1,25 @@
 """Tests for base models."""
+from types import SimpleNamespace
+
 import pytest
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import CRUDMixin, Model
+from app.core.extensions import db
+from app.models.base import (
+    FIELD,
+    OPTIONAL_ISOFORMAT,
+    SET_UPDATED_AT_FUNCTION,
+    CRUDMixin,
+    DictSerializable,
+    Method,
+    Model,
+    install_updated_at_triggers,
+)
+from app.models.category import Category
+from app.models.tag import Tag
+from app.models.types import uuid7
+from app.schemas.user import RoleEnum
 
 
 def test_crud_mixin_methods():
@@ -16,12 +33,16 @@ def test_crud_mixin_methods():
     assert hasattr(CRUDMixin, "update")
     assert hasattr(CRUDMixin, "save")
     assert hasattr(CRUDMixin, "delete")
+    assert hasattr(CRUDMixin, "bulk_create")
+    assert hasattr(CRUDMixin, "bulk_update")
 
     # Check that they are callable
     assert callable(CRUDMixin.create)
     assert callable(CRUDMixin.update)
     assert callable(CRUDMixin.save)
     assert callable(CRUDMixin.delete)
+    assert callable(CRUDMixin.bulk_create)
+    assert callable(CRUDMixin.bulk_update)
 
 
 def test_model_init_valid_kwargs():
@@ -52,3 +73,133 @@ def test_model_init_invalid_kwargs():
         UniqueTestModel(invalid_attribute="value")
 
     assert "Invalid keyword argument: invalid_attribute" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "model_cls, init_kwargs, update_kwargs, save_kwargs",
+    [
+        (
+            Category,
+            {"name": "New Category", "description": "New description"},
+            {"name": "Updated Category"},
+            {"description": "Updated description"},
+        ),
+        (Tag, {"name": "NewTag"}, {"name": "UpdatedTag"}, {"name": "SavedTag"}),
+    ],
+)
+def test_crud_mixin_on_models(
+    db_session, user, model_cls, init_kwargs, update_kwargs, save_kwargs
+):
+    """Test CRUD methods inherited from the base model in concrete models.
+
+    This test ensures that the CRUD methods (`create`, `update`, `save`,
+    `delete`) work as expected, including creating a new record, updating it,
+    saving changes, and deleting the record from the database.
+    """
+    # Create using class method
+    instance = model_cls.create(user_id=user.id, **init_kwargs)
+
+    assert instance.id is not None
+    for attr, value in init_kwargs.items():
+        assert getattr(instance, attr) == value
+
+    # Update the record, leaving the other fields unchanged
+    instance.update(**update_kwargs)
+
+    for attr, value in {**init_kwargs, **update_kwargs}.items():
+        assert getattr(instance, attr) == value
+
+    # Save the record with changes
+    for attr, value in save_kwargs.items():
+        setattr(instance, attr, value)
+    instance.save()
+
+    for attr, value in save_kwargs.items():
+        assert getattr(instance, attr) == value
+
+    # Delete the record
+    instance_id = instance.id
+    instance.delete()
+
+    # Check that it's deleted
+    assert db_session.get(model_cls, instance_id) is None
+
+
+def test_uuid7_is_time_ordered():
+    """Test that uuid7 generates version 7 UUIDs in creation order."""
+    ids = [uuid7() for _ in range(100)]
+
+    assert all(value.version == 7 for value in ids)
+    assert len(set(ids)) == len(ids)
+    assert sorted(ids, key=lambda value: value.int >> 80) == ids
+
+
+def test_dict_serializable_generates_to_dict():
+    """Test that __dict_fields__ is compiled into a to_dict method."""
+
+    class Serializable(DictSerializable):
+        __dict_fields__ = {
+            "name": FIELD,
+            "role": RoleEnum,
+            "seen_at": OPTIONAL_ISOFORMAT,
+            "label": Method("label_for"),
+        }
+
+        name = "example"
+        role = RoleEnum.ADMIN
+        seen_at = None
+
+        def label_for(self):
+            return self.name.upper()
+
+    assert Serializable().to_dict() == {
+        "name": "example",
+        "role": RoleEnum.ADMIN.value,
+        "seen_at": None,
+        "label": "EXAMPLE",
+    }
+    assert Serializable.to_dict.__qualname__.endswith("Serializable.to_dict")
+
+
+def test_dict_serializable_rejects_unknown_kind():
+    """Test that an unsupported field kind fails when the class is defined."""
+    with pytest.raises(TypeError):
+
+        class Invalid(DictSerializable):
+            __dict_fields__ = {"name": "unknown"}
+
+
+def test_updated_at_triggers_only_for_created_tables():
+    """Test that a repeated create_all does not recreate the updated_at triggers.
+
+    SQLAlchemy fires after_create on every create_all call, with the tables it
+    actually created. The trigger DDL is recorded as PostgreSQL would run it
+    while the schema is built twice on a fresh SQLite database.
+    """
+    executed = []
+
+    class PostgresConnection:
+        dialect = SimpleNamespace(name="postgresql")
+
+        def exec_driver_sql(self, statement):
+            executed[-1].append(statement)
+
+    def record_triggers(target, connection, **kw):
+        executed.append([])
+        install_updated_at_triggers(target, PostgresConnection(), **kw)
+
+    engine = create_engine("sqlite://")
+    event.listen(db.metadata, "after_create", record_triggers)
+    try:
+        db.metadata.create_all(engine)
+        db.metadata.create_all(engine)
+    finally:
+        event.remove(db.metadata, "after_create", record_triggers)
+        engine.dispose()
+
+    first, second = executed
+    triggers = [sql for sql in first if "TRIGGER" in sql]
+    assert first[0] == SET_UPDATED_AT_FUNCTION
+    assert len(triggers) == 4
+    assert all(sql.startswith("CREATE OR REPLACE TRIGGER") for sql in triggers)
+    assert second == []
@@ -76,40 +76,3 @@ def test_category_repr(category):
     the expected format with the category's name.
     """
     assert repr(category) == "<Category Test Category>"
-
-
-def test_category_crud_methods(db_session, user):
-    """Test CRUD methods inherited from the base model in Category.
-
-    This test ensures that the Category model's CRUD methods (`create`, `update`,
-    `save`, `delete`) work as expected, including creating a new category, updating it,
-    saving changes, and deleting the category from the database.
-    """
-    # Create using class method
-    category = Category.create(
-        name="New Category", description="New description", user_id=user.id
-    )
-
-    assert category.id is not None
-    assert category.name == "New Category"
-
-    # Update the category
-    category.update(name="Updated Category")
-    db_session.refresh(category)
-
-    assert category.name == "Updated Category"
-    assert category.description == "New description"  # Unchanged
-
-    # Save the category with changes
-    category.description = "Updated description"
-    category.save()
-    db_session.refresh(category)
-
-    assert category.description == "Updated description"
-
-    # Delete the category
-    category_id = category.id
-    category.delete()
-
-    # Check that it's deleted
-    assert db_session.get(Category, category_id) is None
@@ -0,0 +1,83 @@
+"""Tests for cursor pagination of task lists."""
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+from werkzeug.exceptions import BadRequest
+
+from app.models.task import Task
+from app.services.task import list_tasks_by_cursor
+
+from .conftest import persist
+
+
+@pytest.fixture
+def dated_tasks(db_session, user):
+    """Create tasks whose IDs sort opposite to their creation times.
+
+    Rows inserted before time-ordered IDs carry random UUIDs, so pages must
+    follow created_at and not the primary key.
+    """
+    created = datetime(2025, 1, 1, 12, 0, 0)
+    tasks = [
+        Task(
+            id=UUID(int=i + 1),
+            title=f"Task {i}",
+            user_id=user.id,
+            created_at=created - timedelta(minutes=i),
+        )
+        for i in range(5)
+    ]
+    persist(db_session, *tasks)
+    # Newest first
+    return tasks
+
+
+def test_cursor_pages_newest_first(user, dated_tasks):
+    """Test walking every page of tasks with the returned cursors.
+
+    This test verifies that the first page starts with the newest task, that
+    each cursor resumes right after the previous page, and that the last page
+    returns no cursor.
+    """
+    first, cursor = list_tasks_by_cursor(user.id, None, per_page=2)
+    assert first == dated_tasks[:2]
+    assert cursor is not None
+
+    second, cursor = list_tasks_by_cursor(user.id, cursor, per_page=2)
+    assert second == dated_tasks[2:4]
+    assert cursor is not None
+
+    last, cursor = list_tasks_by_cursor(user.id, cursor, per_page=2)
+    assert last == dated_tasks[4:]
+    assert cursor is None
+
+
+def test_cursor_breaks_ties_by_id(db_session, user):
+    """Test that tasks created in the same instant are paged once each."""
+    created = datetime(2025, 1, 1, 12, 0, 0)
+    tasks = [
+        Task(id=UUID(int=i + 1), title=f"Task {i}", user_id=user.id, created_at=created)
+        for i in range(3)
+    ]
+    persist(db_session, *tasks)
+
+    first, cursor = list_tasks_by_cursor(user.id, "", per_page=2)
+    last, cursor = list_tasks_by_cursor(user.id, cursor, per_page=2)
+
+    assert first + last == tasks[::-1]
+    assert cursor is None
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "bnVsbA", "e30"])
+def test_invalid_cursor_is_rejected(user, cursor):
+    """Test that a malformed cursor is rejected with a 400 error."""
+    with pytest.raises(BadRequest):
+        list_tasks_by_cursor(user.id, cursor, per_page=2)
+
+
+@pytest.mark.parametrize("per_page", [0, -1])
+def test_cursor_page_size_must_be_positive(user, per_page):
+    """Test that an empty or negative page size is rejected with a 400 error."""
+    with pytest.raises(BadRequest):
+        list_tasks_by_cursor(user.id, None, per_page=per_page)
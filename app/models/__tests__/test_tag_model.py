@@ -74,35 +74,27 @@ def test_tag_repr(tag):
     assert repr(tag) == "<Tag TestTag>"
 
 
-def test_tag_crud_methods(db_session, user):
-    """Test CRUD methods inherited from the base model in Tag.
+def test_tag_bulk_methods(db_session, user):
+    """Test bulk CRUD methods inherited from the base model in Tag.
 
-    This test ensures that the Tag model's CRUD methods (`create`, `update`,
-    `save`, `delete`) work as expected, including creating a new tag, updating it,
-    saving changes, and deleting the tag from the database.
+    This test ensures that `bulk_create` inserts every mapping and that
+    `bulk_update` updates existing tags by primary key.
     """
-    # Create using class method
-    tag = Tag.create(name="NewTag", user_id=user.id)
-
-    assert tag.id is not None
-    assert tag.name == "NewTag"
-
-    # Update the tag
-    tag.update(name="UpdatedTag")
-    db_session.refresh(tag)
-
-    assert tag.name == "UpdatedTag"
-
-    # Save the tag with changes
-    tag.name = "SavedTag"
-    tag.save()
-    db_session.refresh(tag)
-
-    assert tag.name == "SavedTag"
-
-    # Delete the tag
-    tag_id = tag.id
-    tag.delete()
-
-    # Check that it's deleted
-    assert db_session.get(Tag, tag_id) is None
+    Tag.bulk_create(
+        [
+            {"name": "BulkOne", "user_id": user.id},
+            {"name": "BulkTwo", "user_id": user.id},
+        ]
+    )
+
+    tags = Tag.query.filter_by(user_id=user.id).order_by(Tag.name).all()
+    assert [tag.name for tag in tags] == ["BulkOne", "BulkTwo"]
+    assert all(tag.id is not None for tag in tags)
+
+    Tag.bulk_update([{"id": tag.id, "name": f"{tag.name}Updated"} for tag in tags])
+    db_session.expire_all()
+
+    assert {tag.name for tag in Tag.query.filter_by(user_id=user.id)} == {
+        "BulkOneUpdated",
+        "BulkTwoUpdated",
+    }
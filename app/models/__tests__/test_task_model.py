@@ -1,9 +1,13 @@
 """Tests for Task model and TaskTag association."""
 from datetime import datetime, timedelta
 
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import lazyload
+
 from app.models.tag import Tag
 from app.models.task import Task, TaskTag
 from app.schemas.task import PriorityEnum, StatusEnum
+from app.utils.json import dumpb
 
 
 def test_task_creation(db_session, user, category):
@@ -115,6 +119,26 @@ def test_remove_tag_from_task(db_session, task_with_tags, tag):
     assert len(task_with_tags.tags) == 0
 
 
+def test_remove_tags_from_task(db_session, task_with_tags, tag, user):
+    """Test removing several tags from a task at once."""
+    other_tag = Tag(name="OtherTag", user_id=user.id)
+    task_with_tags.add_tag(other_tag)
+    db_session.commit()
+    assert len(task_with_tags.tags) == 2
+
+    task_with_tags.remove_tags([tag, other_tag])
+    db_session.commit()
+
+    assert task_with_tags.tags == []
+    assert tag.task_tags == []
+    assert (
+        db_session.scalars(
+            select(TaskTag).where(TaskTag.task_id == task_with_tags.id)
+        ).all()
+        == []
+    )
+
+
 def test_is_overdue_method(task, overdue_task):
     """Test the is_overdue method.
 
@@ -168,6 +192,55 @@ def test_task_to_dict(task_with_tags, tag):
     assert task_dict["is_overdue"] is False
 
 
+def test_task_to_json_dict_encodes_like_to_dict(task_with_tags):
+    """Test that to_json_dict produces the same JSON as to_dict."""
+    json_dict = task_with_tags.to_json_dict()
+
+    assert json_dict["created_at"] == task_with_tags.created_at
+    assert dumpb(json_dict) == dumpb(task_with_tags.to_dict())
+
+
+def test_task_to_dict_with_unloaded_relationships(db_session, task_with_tags):
+    """Test that to_dict resolves category and tag names that were not loaded."""
+    task = db_session.scalars(
+        select(Task)
+        .options(lazyload(Task.category), lazyload(Task.task_tags))
+        .where(Task.id == task_with_tags.id)
+        .execution_options(populate_existing=True)
+    ).one()
+    db_session.expire(task, ["category", "task_tags"])
+
+    task_dict = task.to_dict()
+
+    assert task_dict["category"] == "Test Category"
+    assert task_dict["tags"] == ["TestTag"]
+    assert "task_tags" in inspect(task).unloaded
+
+
+def test_list_tasks_to_dict_query_count(db_session, user, category, count_queries):
+    """Test that serializing many tasks does not lazy load per task.
+
+    Tasks are loaded with their category joined and their tags selected in one
+    extra query, so the query count stays constant as the task count grows.
+    """
+    tags = [Tag(name=f"Tag{i}", user_id=user.id) for i in range(3)]
+    for i in range(20):
+        task = Task(title=f"Task {i}", user_id=user.id, category_id=category.id)
+        for tag in tags:
+            task.add_tag(tag)
+        db_session.add(task)
+    db_session.commit()
+    db_session.expunge_all()
+
+    with count_queries() as queries:
+        tasks = db_session.scalars(select(Task).where(Task.user_id == user.id)).all()
+        task_dicts = [task.to_dict() for task in tasks]
+
+    assert len(task_dicts) == 20
+    assert all(len(task_dict["tags"]) == 3 for task_dict in task_dicts)
+    assert len(queries) <= 3
+
+
 def test_task_repr(task):
     """Test the string representation of a task.
 
@@ -199,7 +272,6 @@ def test_task_crud_methods(db_session, user, category):
 
     # Update the task
     task.update(title="Updated Task", status=StatusEnum.IN_PROGRESS)
-    db_session.refresh(task)
 
     assert task.title == "Updated Task"
     assert task.status == StatusEnum.IN_PROGRESS
@@ -208,7 +280,6 @@ def test_task_crud_methods(db_session, user, category):
     # Save the task with changes
     task.description = "Updated description"
     task.save()
-    db_session.refresh(task)
 
     assert task.description == "Updated description"
 
@@ -3,6 +3,7 @@ from datetime import datetime
 
 from app.models.user import User
 from app.schemas.user import RoleEnum
+from app.utils.security import hash_password, needs_rehash
 
 
 def test_user_creation(db_session):
@@ -38,6 +39,17 @@ def test_user_password(user):
     assert user.check_password("newpassword") is True
 
 
+def test_user_password_uses_configured_rounds(app, user):
+    """Test that new hashes use the app's bcrypt work factor."""
+    rounds = app.config["BCRYPT_ROUNDS"]
+
+    user.set_password("newpassword")
+
+    assert user.password_hash.startswith("$2b$%02d$" % rounds)
+    assert needs_rehash(user.password_hash) is False
+    assert needs_rehash(hash_password("newpassword", rounds=rounds + 1)) is True
+
+
 def test_user_update_last_login(user, db_session):
     """Test updating the last login timestamp."""
     assert user.last_login is None
@@ -84,3 +96,21 @@ def test_user_relationships(user, task, category, tag):
     assert user.categories[0].id == category.id
     assert len(user.tags) == 1
     assert user.tags[0].id == tag.id
+
+
+def test_user_bulk_create_with_passwords(db_session):
+    """Test creating users in bulk from plain text passwords."""
+    User.bulk_create_with_passwords(
+        [
+            {"username": "bulkone", "email": "one@example.com", "password": "secret1"},
+            {"username": "bulktwo", "email": "two@example.com", "password": "secret2"},
+        ]
+    )
+
+    users = User.query.filter(User.username.in_(["bulkone", "bulktwo"])).all()
+    passwords = {"bulkone": "secret1", "bulktwo": "secret2"}
+
+    assert len(users) == 2
+    for user in users:
+        assert user.role == RoleEnum.USER
+        assert user.check_password(passwords[user.username]) is True
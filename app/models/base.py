@@ -1,21 +1,40 @@
 """Database connection and models setup."""
-from datetime import datetime, timezone
+from datetime import datetime
+from enum import Enum
+from typing import NamedTuple
 
-from sqlalchemy import DateTime
-from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy import event, func, insert, update
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.extensions import db
 
+from .types import TIMESTAMP
+
 
 class CRUDMixin:
     """Mixin that adds convenience methods for CRUD operations."""
 
     @classmethod
-    def create(cls, **kwargs):
+    def create(cls, commit=True, **kwargs):
         """Create a new record and save it to the database."""
         instance = cls(**kwargs)
-        return instance.save()
+        return instance.save(commit=commit)
+
+    @classmethod
+    def bulk_create(cls, rows, commit=True):
+        """Insert many records from a list of column mappings at once."""
+        if rows:
+            db.session.execute(insert(cls), rows)
+        if commit:
+            db.session.commit()
+
+    @classmethod
+    def bulk_update(cls, rows, commit=True):
+        """Update many records from column mappings that include primary keys."""
+        if rows:
+            db.session.execute(update(cls), rows)
+        if commit:
+            db.session.commit()
 
     def update(self, commit=True, **kwargs):
         """Update specific fields of a record."""
@@ -40,39 +59,189 @@ class CRUDMixin:
         return self
 
 
-class Model(CRUDMixin, db.Model):
+# Field kinds understood by DictSerializable
+FIELD = "field"
+ISOFORMAT = "isoformat"
+OPTIONAL_ISOFORMAT = "optional_isoformat"
+
+
+class Method(NamedTuple):
+    """Field kind whose value is the result of calling a method without arguments."""
+
+    name: str
+
+
+class DictSerializable:
+    """
+    Mixin that generates a specialized to_dict from a declarative field spec.
+
+    Subclasses set ``__dict_fields__`` to a mapping of output key to field kind:
+    FIELD, ISOFORMAT, OPTIONAL_ISOFORMAT, an Enum class (serialized by value) or
+    a Method. The spec is compiled into a single dict display once per class, so
+    serialization does no per-field branching at runtime.
+
+    A second method, to_json_dict, keeps date and datetime values as is for the
+    orjson response encoder, which formats them identically to isoformat in C.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the dict methods for subclasses that declare a field spec."""
+        super().__init_subclass__(**kwargs)
+        fields = cls.__dict__.get("__dict_fields__")
+        if fields is not None:
+            cls.to_dict = _compile_to_dict(cls, fields, "to_dict")
+            cls.to_json_dict = _compile_to_dict(
+                cls, fields, "to_json_dict", raw_dates=True
+            )
+
+
+def _field_source(key, kind, namespace, raw_dates=False):
+    """Return the expression serializing one field, binding helpers in namespace."""
+    if kind == FIELD or (raw_dates and kind in (ISOFORMAT, OPTIONAL_ISOFORMAT)):
+        return f"self.{key}"
+    # isoformat stays a method call: it serves both date and datetime columns, and
+    # CPython's method call path is no slower than a pre-bound datetime.isoformat
+    if kind == ISOFORMAT:
+        return f"self.{key}.isoformat()"
+    if kind == OPTIONAL_ISOFORMAT:
+        return f"(value.isoformat() if (value := self.{key}) else None)"
+    if isinstance(kind, Method):
+        return f"self.{kind.name}()"
+    if isinstance(kind, type) and issubclass(kind, Enum):
+        # Enum .value is a descriptor, so map members to values up front
+        namespace[f"_{key}_values"] = {member: member.value for member in kind}
+        return f"_{key}_values[self.{key}]"
+    raise TypeError(f"Unsupported dict field kind for {key!r}: {kind!r}")
+
+
+def _compile_to_dict(cls, fields, name, raw_dates=False):
+    """Generate a dict method called name for a field spec."""
+    namespace = {}
+    items = []
+    for key, kind in fields.items():
+        if not key.isidentifier():
+            raise ValueError(f"Invalid dict field name: {key!r}")
+        source = _field_source(key, kind, namespace, raw_dates)
+        items.append(f"        {key!r}: {source},")
+    source = f"def {name}(self):\n    return {{\n" + "\n".join(items) + "\n    }\n"
+    # Built only from validated identifiers and the fixed templates above
+    exec(compile(source, f"<{cls.__name__}.{name}>", "exec"), namespace)  # nosec B102
+
+    method = namespace[name]
+    method.__qualname__ = f"{cls.__qualname__}.{name}"
+    method.__module__ = cls.__module__
+    if raw_dates:
+        method.__doc__ = (
+            f"Convert the {cls.__name__.lower()} to a JSON-ready dictionary."
+        )
+    else:
+        method.__doc__ = f"Convert the {cls.__name__.lower()} to a dictionary."
+    return method
+
+
+class Model(CRUDMixin, DictSerializable, db.Model):
     """Base model class that includes CRUD convenience methods."""
 
     __abstract__ = True
 
-    @declared_attr
-    def __tablename__(cls):
-        """Return snake-case of the class name."""
-        return cls.__name__.lower()
+    # Attribute shown by __repr__
+    __repr_field__ = "id"
+
+    def __init_subclass__(cls, **kwargs):
+        """Set the table name to the lowercased class name once per subclass."""
+        if not cls.__dict__.get("__abstract__", False) and (
+            "__tablename__" not in cls.__dict__
+        ):
+            cls.__tablename__ = cls.__name__.lower()
+        super().__init_subclass__(**kwargs)
+
+    @classmethod
+    def _allowed_kwargs(cls):
+        """Return the attribute names accepted by __init__, built once per class."""
+        allowed = cls.__dict__.get("_init_kwargs")
+        if allowed is None:
+            # Built on first use because the mapper does not exist yet in
+            # __init_subclass__
+            allowed = frozenset(dir(cls))
+            cls._init_kwargs = allowed
+        return allowed
 
     def __init__(self, **kwargs):
         """Allow initialization with keyword arguments."""
         super().__init__()
+        invalid = kwargs.keys() - self._allowed_kwargs()
+        if invalid:
+            raise TypeError(f"Invalid keyword argument: {', '.join(sorted(invalid))}")
         for key, value in kwargs.items():
-            if not hasattr(self, key):
-                raise TypeError(f"Invalid keyword argument: {key}")
             setattr(self, key, value)
 
+    def __repr__(self) -> str:
+        """Return a string representation without loading expired attributes."""
+        # Read the instance dict so logging a model never triggers a lazy SELECT
+        value = self.__dict__.get(self.__repr_field__)
+        return "<%s %s>" % (type(self).__name__, value)
+
 
 class TimeStampedModel(Model):
     """Base model class that includes timestamp fields."""
 
     __abstract__ = True
 
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc),
+        TIMESTAMP,
+        server_default=func.now(),
         nullable=False,
         doc="The created at date.",
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        TIMESTAMP,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
         doc="The updated at date.",
     )
+
+
+# Backstop for writes that bypass the ORM, which already sets updated_at itself
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at := now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def updated_at_trigger(table_name: str) -> str:
+    """Return the DDL (re)creating the updated_at trigger for a table."""
+    return (
+        f"CREATE OR REPLACE TRIGGER trg_{table_name}_updated_at "
+        f'BEFORE UPDATE ON "{table_name}" '
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+
+
+@event.listens_for(db.metadata, "before_create")
+def install_pg_trgm(target, connection, **kw):
+    """Enable the trigram operator classes used by the title search index."""
+    if connection.dialect.name != "postgresql":
+        return
+    connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+@event.listens_for(db.metadata, "after_create")
+def install_updated_at_triggers(target, connection, **kw):
+    """Create the updated_at triggers of the tables created on PostgreSQL."""
+    # create_all fires this event even when every table already exists
+    tables = [table for table in kw.get("tables", ()) if "updated_at" in table.c]
+    if connection.dialect.name != "postgresql" or not tables:
+        return
+    connection.exec_driver_sql(SET_UPDATED_AT_FUNCTION)
+    for table in tables:
+        connection.exec_driver_sql(updated_at_trigger(table.name))
@@ -1,17 +1,29 @@
 """Category model for task categorization."""
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import TimeStampedModel
+from .base import FIELD, ISOFORMAT, TimeStampedModel
+from .types import GUID, uuid7
 
 
 class Category(TimeStampedModel):
     """Category model for tasks."""
 
+    __table_args__ = (Index("ix_category_user_name", "user_id", "name"),)
+    __repr_field__ = "name"
+    __dict_fields__ = {
+        "id": FIELD,
+        "name": FIELD,
+        "description": FIELD,
+        "user_id": FIELD,
+        "created_at": ISOFORMAT,
+        "updated_at": ISOFORMAT,
+    }
+
     id: Mapped[UUID] = mapped_column(
-        primary_key=True, default=uuid4, doc="The category's unique identifier."
+        GUID, primary_key=True, default=uuid7, doc="The category's unique identifier."
     )
     name: Mapped[str] = mapped_column(
         String(64), nullable=False, doc="The category's name."
@@ -26,18 +38,3 @@ class Category(TimeStampedModel):
     # Relationships
     user = relationship("User", back_populates="categories")
     tasks = relationship("Task", back_populates="category")
-
-    def to_dict(self) -> dict:
-        """Convert the category to a dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "user_id": self.user_id,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
-
-    def __repr__(self) -> str:
-        """Return a string representation of the category."""
-        return f"<Category {self.name}>"
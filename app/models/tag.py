@@ -1,17 +1,28 @@
 """Tag model for task labeling."""
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import TimeStampedModel
+from .base import FIELD, ISOFORMAT, TimeStampedModel
+from .types import GUID, uuid7
 
 
 class Tag(TimeStampedModel):
     """Tag model for tasks."""
 
+    __table_args__ = (Index("ix_tag_user_name", "user_id", "name", unique=True),)
+    __repr_field__ = "name"
+    __dict_fields__ = {
+        "id": FIELD,
+        "name": FIELD,
+        "user_id": FIELD,
+        "created_at": ISOFORMAT,
+        "updated_at": ISOFORMAT,
+    }
+
     id: Mapped[UUID] = mapped_column(
-        primary_key=True, default=uuid4, doc="The tag's unique identifier."
+        GUID, primary_key=True, default=uuid7, doc="The tag's unique identifier."
     )
     name: Mapped[str] = mapped_column(String(64), nullable=False, doc="The tag's name.")
 
@@ -25,17 +36,3 @@ class Tag(TimeStampedModel):
     task_tags = relationship(
         "TaskTag", back_populates="tag", cascade="all, delete-orphan"
     )
-
-    def to_dict(self) -> dict:
-        """Convert the tag to a dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "user_id": self.user_id,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
-
-    def __repr__(self) -> str:
-        """Return a string representation of the tag."""
-        return f"<Tag {self.name}>"
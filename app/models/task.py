@@ -1,22 +1,43 @@
 """Task model for user tasks."""
 from datetime import datetime
-from typing import List
-from uuid import UUID, uuid4
-
-from sqlalchemy import Date, Enum, ForeignKey, String
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    ForeignKey,
+    Index,
+    String,
+    delete,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.extensions import db
 from app.schemas.task import PriorityEnum, StatusEnum
+from app.utils.dates import today
 
-from .base import TimeStampedModel
+from .base import FIELD, ISOFORMAT, OPTIONAL_ISOFORMAT, Method, TimeStampedModel
+from .category import Category
 from .tag import Tag
+from .types import GUID, uuid7
+
+
+def _values_check(column: str, enum) -> str:
+    """Build the CHECK expression limiting a column to an enum's values."""
+    values = ", ".join(f"'{member.value}'" for member in enum)
+    return f"{column} IN ({values})"
 
 
 class TaskTag(db.Model):
     """Association table for Task-Tag many-to-many relationship."""
 
     __tablename__ = "task_tag"
+    __table_args__ = (Index("ix_task_tag_tag_id", "tag_id"),)
 
     task_id: Mapped[UUID] = mapped_column(
         ForeignKey("task.id"), primary_key=True, doc="The task's unique identifier."
@@ -27,28 +48,70 @@ class TaskTag(db.Model):
 
     # Relationships
     task = relationship("Task", back_populates="task_tags")
-    tag = relationship("Tag", back_populates="task_tags")
+    tag = relationship("Tag", back_populates="task_tags", lazy="joined")
 
 
 class Task(TimeStampedModel):
     """Task model."""
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    __table_args__ = (
+        Index("ix_task_user_status_due", "user_id", "status", "due_date"),
+        Index("ix_task_user_due", "user_id", "due_date"),
+        Index("ix_task_user_created", "user_id", "created_at"),
+        Index("ix_task_category", "category_id"),
+        # Only open tasks can be overdue
+        Index(
+            "ix_task_user_overdue",
+            "user_id",
+            "due_date",
+            postgresql_where=text("status <> 'Ready'"),
+            sqlite_where=text("status <> 'Ready'"),
+        ),
+        # Trigram index serving the title ILIKE search on PostgreSQL
+        Index(
+            "ix_task_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        CheckConstraint(_values_check("status", StatusEnum), name="ck_task_status"),
+        CheckConstraint(
+            _values_check("priority", PriorityEnum), name="ck_task_priority"
+        ),
+    )
+    __repr_field__ = "title"
+    __dict_fields__ = {
+        "id": FIELD,
+        "title": FIELD,
+        "description": FIELD,
+        "status": FIELD,
+        "priority": FIELD,
+        "due_date": OPTIONAL_ISOFORMAT,
+        "user_id": FIELD,
+        "category_id": FIELD,
+        "category": Method("_category_name"),
+        "tags": Method("_tag_names"),
+        "created_at": ISOFORMAT,
+        "updated_at": ISOFORMAT,
+        "is_overdue": Method("is_overdue"),
+    }
+
+    id: Mapped[UUID] = mapped_column(GUID, primary_key=True, default=uuid7)
     title: Mapped[str] = mapped_column(
         String(128), nullable=False, doc="The task's title"
     )
     description: Mapped[str] = mapped_column(
         String(1024), nullable=True, doc="The task's description"
     )
-    status: Mapped[StatusEnum] = mapped_column(
-        Enum(StatusEnum),
-        default=StatusEnum.TODO,
+    status: Mapped[str] = mapped_column(
+        String(16),
+        default=StatusEnum.TODO.value,
         nullable=False,
         doc="The task's status",
     )
-    priority: Mapped[PriorityEnum] = mapped_column(
-        Enum(PriorityEnum),
-        default=PriorityEnum.MEDIUM,
+    priority: Mapped[str] = mapped_column(
+        String(16),
+        default=PriorityEnum.MEDIUM.value,
         nullable=False,
         doc="The task's priority",
     )
@@ -68,53 +131,62 @@ class Task(TimeStampedModel):
 
     # Relationships
     user = relationship("User", back_populates="tasks")
-    category = relationship("Category", back_populates="tasks")
+    # Loaded eagerly since to_dict always reads the category and tag names
+    category = relationship("Category", back_populates="tasks", lazy="joined")
     task_tags = relationship(
-        "TaskTag", back_populates="task", cascade="all, delete-orphan"
+        "TaskTag",
+        back_populates="task",
+        cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
-    @property
-    def tags(self) -> List[Tag]:
-        """Get the tags associated with this task."""
-        return [task_tag.tag for task_tag in self.task_tags]
+    # Tags reached through the task_tags association objects
+    tags = association_proxy("task_tags", "tag", creator=lambda tag: TaskTag(tag=tag))
 
     def add_tag(self, tag: Tag) -> None:
         """Add a tag to this task."""
-        task_tag = TaskTag(task=self, tag=tag)
-        db.session.add(task_tag)
+        self.tags.append(tag)
 
     def remove_tag(self, tag: Tag) -> None:
         """Remove a tag from this task."""
-        task_tag = (
-            db.session.query(TaskTag).filter_by(task_id=self.id, tag_id=tag.id).first()
+        self.remove_tags([tag])
+
+    def remove_tags(self, tags: List[Tag]) -> None:
+        """Remove several tags from this task with a single DELETE."""
+        if not tags:
+            return
+        db.session.execute(
+            delete(TaskTag).where(
+                TaskTag.task_id == self.id,
+                TaskTag.tag_id.in_([tag.id for tag in tags]),
+            )
         )
-        if task_tag:
-            db.session.delete(task_tag)
+        # The DELETE bypasses the collections, so reload them on next access
+        for instance in (self, *tags):
+            if inspect(instance).persistent:
+                db.session.expire(instance, ["task_tags"])
 
     def is_overdue(self) -> bool:
         """Check if the task is overdue."""
-        if not self.due_date:
-            return False
-        return self.due_date < datetime.now().date()
-
-    def to_dict(self) -> dict:
-        """Convert the task to a dictionary."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "status": self.status.value,
-            "priority": self.priority.value,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "user_id": self.user_id,
-            "category_id": self.category_id,
-            "category": self.category.name if self.category else None,
-            "tags": [tag.name for tag in self.tags],
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "is_overdue": self.is_overdue(),
-        }
-
-    def __repr__(self) -> str:
-        """Return a string representation of the task."""
-        return f"<Task {self.title}>"
+        due_date = self.due_date
+        return due_date is not None and due_date < today()
+
+    def _category_name(self) -> Optional[str]:
+        """Return the category name without lazy loading the relationship."""
+        if "category" not in inspect(self).unloaded:
+            category = self.category
+            return category.name if category else None
+        if self.category_id is None:
+            return None
+        return db.session.scalar(
+            select(Category.name).where(Category.id == self.category_id)
+        )
+
+    def _tag_names(self) -> List[str]:
+        """Return the tag names in one joined query when tags were not loaded."""
+        state = inspect(self)
+        if "task_tags" not in state.unloaded or not state.persistent:
+            return [tag.name for tag in self.tags]
+        return db.session.scalars(
+            select(Tag.name).join(TaskTag).where(TaskTag.task_id == self.id)
+        ).all()
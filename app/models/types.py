@@ -0,0 +1,36 @@
+"""Column types and defaults shared by the models."""
+import os
+import time
+from uuid import UUID
+
+from sqlalchemy import DateTime, Uuid
+from sqlalchemy.dialects import sqlite
+
+# Native 16 byte UUID on PostgreSQL, CHAR(32) on backends without one
+GUID = Uuid(as_uuid=True)
+
+# SQLite stores CURRENT_TIMESTAMP defaults as text without fractional seconds,
+# bind values in the same format so comparisons against them hold
+TIMESTAMP = DateTime().with_variant(
+    sqlite.DATETIME(truncate_microseconds=True), "sqlite"
+)
+
+_VERSION_MASK = ~(0xF << 76) & ((1 << 128) - 1)
+_VARIANT_MASK = ~(0x3 << 62) & ((1 << 128) - 1)
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered version 7 UUID.
+
+    The leading 48 bits hold the Unix time in milliseconds, so new rows are
+    appended to the end of primary key indexes instead of splitting random pages.
+
+    Returns:
+        A new UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), "big")
+    value = (value & _VERSION_MASK) | (0x7 << 76)
+    value = (value & _VARIANT_MASK) | (0x2 << 62)
+    return UUID(int=value)
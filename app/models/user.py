@@ -1,21 +1,36 @@
 """User model for authentication and authorization."""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from uuid import UUID, uuid4
+from functools import partial
+from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, String
+from sqlalchemy import DateTime, Enum, String, update
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.extensions import db
 from app.schemas.user import RoleEnum
-from app.utils.security import check_password, hash_password
+from app.utils.security import bcrypt_rounds, check_password, hash_password
 
-from .base import TimeStampedModel
+from .base import FIELD, ISOFORMAT, OPTIONAL_ISOFORMAT, TimeStampedModel
+from .types import GUID, uuid7
 
 
 class User(TimeStampedModel):
     """User model."""
 
+    __repr_field__ = "username"
+    __dict_fields__ = {
+        "id": FIELD,
+        "username": FIELD,
+        "email": FIELD,
+        "role": RoleEnum,
+        "created_at": ISOFORMAT,
+        "updated_at": ISOFORMAT,
+        "last_login": OPTIONAL_ISOFORMAT,
+    }
+
     id: Mapped[UUID] = mapped_column(
-        primary_key=True, default=uuid4, doc="The user's unique identifier."
+        GUID, primary_key=True, default=uuid7, doc="The user's unique identifier."
     )
     username: Mapped[str] = mapped_column(
         String(64), unique=True, nullable=False, index=True, doc="The user's username."
@@ -41,12 +56,26 @@ class User(TimeStampedModel):
     tags = relationship("Tag", back_populates="user", cascade="all, delete-orphan")
 
     def __init__(self, **kwargs):
-        """Initialize a new user."""
+        """Initialize a new user, hashing the password unless a hash is given."""
         password = kwargs.pop("password", None)
         super(User, self).__init__(**kwargs)
-        if password:
+        if password and "password_hash" not in kwargs:
             self.set_password(password)
 
+    @classmethod
+    def bulk_create_with_passwords(cls, rows, commit=True):
+        """Insert many users, hashing their plain text passwords concurrently."""
+        rows = [dict(row) for row in rows]
+        # Worker threads have no app context, so read the work factor here
+        hash_with_rounds = partial(hash_password, rounds=bcrypt_rounds())
+        # bcrypt releases the GIL while hashing, so threads run on separate cores
+        with ThreadPoolExecutor() as executor:
+            passwords = [row.pop("password") for row in rows]
+            hashes = executor.map(hash_with_rounds, passwords)
+            for row, password_hash in zip(rows, hashes):
+                row["password_hash"] = password_hash
+        cls.bulk_create(rows, commit=commit)
+
     def set_password(self, password: str) -> None:
         """Set the user's password hash."""
         self.password_hash = hash_password(password)
@@ -56,22 +85,11 @@ class User(TimeStampedModel):
         return check_password(password, self.password_hash)
 
     def update_last_login(self) -> None:
-        """Update the last login timestamp."""
-        self.last_login = datetime.now(timezone.utc)
-        self.save()
-
-    def to_dict(self) -> dict:
-        """Convert the user to a dictionary."""
-        return {
-            "id": self.id,
-            "username": self.username,
-            "email": self.email,
-            "role": self.role.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "last_login": self.last_login.isoformat() if self.last_login else None,
-        }
-
-    def __repr__(self) -> str:
-        """Return a string representation of the user."""
-        return f"<User {self.username}>"
+        """Update the last login timestamp with a single column UPDATE."""
+        db.session.execute(
+            update(User)
+            .where(User.id == self.id)
+            .values(last_login=datetime.now(timezone.utc)),
+            execution_options={"synchronize_session": False},
+        )
+        db.session.commit()
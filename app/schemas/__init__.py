@@ -1,22 +1,30 @@
 """Base Pydantic schemas for data validation."""
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Annotated, Any, Dict, Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, model_validator
 
 T = TypeVar("T")
 
+# Largest page the list endpoints serve
+MAX_PER_PAGE = 100
+
+
+def _isoformat(value: datetime) -> str:
+    """Serialize a datetime the way datetime.isoformat does."""
+    return value.isoformat()
+
+
+# Datetime serialized to JSON with isoformat, keeping "+00:00" rather than "Z"
+IsoDateTime = Annotated[
+    datetime, PlainSerializer(_isoformat, return_type=str, when_used="json")
+]
+
 
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
 
-    class Config:
-        """Pydantic model configuration."""
-
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ResponseSchema(BaseSchema, Generic[T]):
@@ -45,3 +53,24 @@ class PaginatedResponseSchema(ResponseSchema[List[T]]):
         if total is not None and per_page:
             values["pages"] = (total + per_page - 1) // per_page
         return values
+
+
+class PageParams(BaseModel):
+    """Pagination query parameters of the list endpoints."""
+
+    page: int = Field(default=1, ge=1, description="Page number", examples=[1])
+    per_page: int = Field(
+        default=20,
+        ge=1,
+        le=MAX_PER_PAGE,
+        description="Number of items per page",
+        examples=[10],
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Cursor pagination, newest first: empty for the first page, then "
+            "the next_cursor of the previous page. Ignores page"
+        ),
+        examples=[""],
+    )
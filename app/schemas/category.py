@@ -1,11 +1,10 @@
 """Pydantic schemas for Category model."""
-from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
-from app.schemas import BaseSchema, ResponseSchema
+from app.schemas import BaseSchema, IsoDateTime, ResponseSchema
 
 
 class CategoryBase(BaseSchema):
@@ -49,10 +48,7 @@ class CategoryUpdate(BaseSchema):
         examples=["Updated description for category"],
     )
 
-    class ConfigDict:
-        """Configuration for CategoryUpdate schema."""
-
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class CategoryInDB(CategoryBase):
@@ -62,13 +58,13 @@ class CategoryInDB(CategoryBase):
     user_id: UUID = Field(
         description="The ID of the user who owns this category", examples=[42]
     )
-    created_at: datetime = Field(
+    created_at: IsoDateTime = Field(
         description="The date and time the category was created",
-        examples=[datetime.now()],
+        examples=["2025-01-01T00:00:00Z"],
     )
-    updated_at: datetime = Field(
+    updated_at: IsoDateTime = Field(
         description="The date and time the category was last updated",
-        examples=[datetime.now()],
+        examples=["2025-01-01T00:00:00Z"],
     )
 
 
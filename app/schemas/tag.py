@@ -1,11 +1,10 @@
 """Pydantic schemas for Tag model."""
-from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
-from app.schemas import BaseSchema, ResponseSchema
+from app.schemas import BaseSchema, IsoDateTime, ResponseSchema
 
 
 class TagBase(BaseSchema):
@@ -37,10 +36,7 @@ class TagUpdate(BaseSchema):
         examples=["updated-tag-name"],
     )
 
-    class ConfigDict:
-        """Configuration for TagUpdate schema."""
-
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class TagInDB(TagBase):
@@ -50,11 +46,13 @@ class TagInDB(TagBase):
     user_id: UUID = Field(
         description="The ID of the user who owns this tag", examples=[42]
     )
-    created_at: datetime = Field(
-        description="Timestamp when the tag was created", examples=[datetime.now()]
+    created_at: IsoDateTime = Field(
+        description="Timestamp when the tag was created",
+        examples=["2025-01-01T00:00:00Z"],
     )
-    updated_at: datetime = Field(
-        description="Timestamp when the tag was last updated", examples=[datetime.now()]
+    updated_at: IsoDateTime = Field(
+        description="Timestamp when the tag was last updated",
+        examples=["2025-01-01T00:00:00Z"],
     )
 
 
@@ -75,10 +73,8 @@ class TagStats(TagInDB):
 
     task_count: int = Field(description="Number of tasks using this tag", examples=[5])
 
-    class ConfigDict:
-        """Additional configuration for TagStats schema."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "urgent",
@@ -88,6 +84,7 @@ class TagStats(TagInDB):
                 "task_count": 5,
             }
         }
+    )
 
 
 class TagStatsResponse(ResponseSchema[List[TagStats]]):
@@ -1,24 +1,29 @@
 """Pydantic schemas for Task model."""
-from datetime import date, datetime
+from datetime import date
 from enum import Enum
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, model_validator
 
-from app.schemas import BaseSchema, ResponseSchema
+from app.schemas import MAX_PER_PAGE, BaseSchema, IsoDateTime, ResponseSchema
 
+TaskSortField = Literal[
+    "created_at", "updated_at", "due_date", "priority", "status", "title"
+]
+SortOrder = Literal["asc", "desc"]
 
-class StatusEnum(Enum):
-    """Task status enumeration."""
+
+class StatusEnum(str, Enum):
+    """Task status enumeration, stored by value."""
 
     TODO = "To Do"
     IN_PROGRESS = "In Progress"
     READY = "Ready"
 
 
-class PriorityEnum(Enum):
-    """Task priority enumeration."""
+class PriorityEnum(str, Enum):
+    """Task priority enumeration, stored by value."""
 
     LOW = "Low"
     MEDIUM = "Medium"
@@ -63,7 +68,7 @@ class TaskCreate(TaskBase):
     """Schema for creating a new task."""
 
     tag_ids: Optional[List[UUID]] = Field(
-        default_factory=list,
+        default=None,
         description="List of tag IDs to assign to the task",
         examples=[[1, 2, 3]],
     )
@@ -101,10 +106,7 @@ class TaskUpdate(BaseSchema):
         default=None, description="Updated list of tag IDs", examples=[[3, 4]]
     )
 
-    class ConfigDict:
-        """Configuration for TaskUpdate schema."""
-
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class TaskTagUpdate(BaseSchema):
@@ -122,11 +124,11 @@ class TaskInDB(TaskBase):
     user_id: UUID = Field(
         ..., description="ID of the user who owns the task", examples=[42]
     )
-    created_at: datetime = Field(
-        ..., description="Creation timestamp", examples=[datetime.now()]
+    created_at: IsoDateTime = Field(
+        ..., description="Creation timestamp", examples=["2025-01-01T00:00:00Z"]
     )
-    updated_at: datetime = Field(
-        ..., description="Last update timestamp", examples=[datetime.now()]
+    updated_at: IsoDateTime = Field(
+        ..., description="Last update timestamp", examples=["2025-01-01T00:00:00Z"]
     )
     is_overdue: bool = Field(
         ..., description="Whether the task is overdue", examples=[False]
@@ -140,17 +142,6 @@ class TaskInDB(TaskBase):
         examples=[["urgent", "client"]],
     )
 
-    @field_validator("is_overdue", mode="before")
-    @classmethod
-    def calculate_overdue(cls, v, values):
-        """Calculate if the task is overdue if not provided."""
-        if v is not None:
-            return v
-        due_date = values.get("due_date")
-        if due_date:
-            return due_date < datetime.now().date()
-        return False
-
 
 class TaskResponse(ResponseSchema[TaskInDB]):
     """Response schema for a single task."""
@@ -191,47 +182,35 @@ class TaskSearchParams(BaseSchema):
     due_date_to: Optional[date] = Field(
         None, description="End of due date range", examples=["2025-04-30"]
     )
-    sort_by: Optional[str] = Field(
+    sort_by: TaskSortField = Field(
         default="created_at", description="Field to sort by", examples=["due_date"]
     )
-    sort_order: Optional[str] = Field(
+    sort_order: SortOrder = Field(
         default="desc", description="Sort order: 'asc' or 'desc'", examples=["asc"]
     )
-    page: int = Field(default=1, description="Pagination page number", examples=[1])
-    per_page: int = Field(
-        default=20, description="Number of tasks per page", examples=[10]
+    page: int = Field(
+        default=1, ge=1, description="Pagination page number", examples=[1]
     )
-
-    @field_validator("due_date_to")
-    @classmethod
-    def validate_due_date_range(cls, v, values):
+    per_page: int = Field(
+        default=20,
+        ge=1,
+        le=MAX_PER_PAGE,
+        description="Number of tasks per page",
+        examples=[10],
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Cursor pagination, newest first: empty for the first page, then "
+            "the next_cursor of the previous page. Ignores sorting and page"
+        ),
+        examples=[""],
+    )
+
+    @model_validator(mode="after")
+    def validate_due_date_range(self) -> "TaskSearchParams":
         """Validate that due_date_to is after due_date_from."""
-        due_date_from = values.get("due_date_from")
-        if v and due_date_from:
-            if v < due_date_from:
+        if self.due_date_to and self.due_date_from:
+            if self.due_date_to < self.due_date_from:
                 raise ValueError("due_date_to must be after due_date_from")
-        return v
-
-    @field_validator("sort_by")
-    @classmethod
-    def validate_sort_by(cls, v):
-        """Validate sort_by field."""
-        valid_fields = [
-            "created_at",
-            "updated_at",
-            "due_date",
-            "priority",
-            "status",
-            "title",
-        ]
-        if v not in valid_fields:
-            raise ValueError(f"sort_by must be one of: {', '.join(valid_fields)}")
-        return v
-
-    @field_validator("sort_order")
-    @classmethod
-    def validate_sort_order(cls, v):
-        """Validate sort_order field."""
-        if v not in ["asc", "desc"]:
-            raise ValueError("sort_order must be either 'asc' or 'desc'")
-        return v
+        return self
@@ -1,16 +1,14 @@
 """Pydantic schemas for User model."""
-from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import EmailStr, Field, field_validator
-from pydantic_core.core_schema import FieldValidationInfo
+from pydantic import ConfigDict, EmailStr, Field, model_validator
 
-from app.schemas import BaseSchema, ResponseSchema
+from app.schemas import BaseSchema, IsoDateTime, ResponseSchema
 
 
-class RoleEnum(Enum):
+class RoleEnum(str, Enum):
     """User role enumeration."""
 
     ADMIN = "admin"
@@ -42,14 +40,12 @@ class UserCreate(UserBase):
         min_length=8, description="The user password", examples=["password123"]
     )
 
-    @field_validator("confirm_password")
-    @classmethod
-    def passwords_match(cls, v: str, info: FieldValidationInfo) -> str:
+    @model_validator(mode="after")
+    def passwords_match(self) -> "UserCreate":
         """Validate that password and confirm_password match."""
-        password = info.data.get("password")  # Access sibling fields
-        if password and v != password:
+        if self.password != self.confirm_password:
             raise ValueError("Passwords do not match")
-        return v
+        return self
 
 
 class UserUpdate(BaseSchema):
@@ -72,10 +68,7 @@ class UserUpdate(BaseSchema):
         examples=["password123"],
     )
 
-    class ConfigDict:
-        """Configuration for UserUpdate schema."""
-
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class UserInDB(UserBase):
@@ -84,14 +77,16 @@ class UserInDB(UserBase):
     id: UUID = Field(
         description="The user ID", examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
-    created_at: datetime = Field(
-        description="The user creation date", examples=[datetime.now()]
+    created_at: IsoDateTime = Field(
+        description="The user creation date", examples=["2025-01-01T00:00:00Z"]
     )
-    updated_at: datetime = Field(
-        description="The user update date", examples=[datetime.now()]
+    updated_at: IsoDateTime = Field(
+        description="The user update date", examples=["2025-01-01T00:00:00Z"]
     )
-    last_login: Optional[datetime] = Field(
-        default=None, description="The user last login date", examples=[datetime.now()]
+    last_login: Optional[IsoDateTime] = Field(
+        default=None,
+        description="The user last login date",
+        examples=["2025-01-01T00:00:00Z"],
     )
 
 
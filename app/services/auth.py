@@ -1,5 +1,7 @@
 """Authentication service functions."""
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from uuid import UUID
 
@@ -7,9 +9,23 @@ import jwt
 from flask import abort, current_app
 from sqlalchemy.exc import IntegrityError
 
-from app.core.config import get_settings
 from app.core.extensions import db
 from app.models.user import RoleEnum, User
+from app.services.user import get_user_by_email, get_user_by_username
+from app.utils.security import needs_rehash
+
+JWT_ALGORITHM = "HS256"
+
+
+@lru_cache(maxsize=8)
+def _encode_key(secret_key: str) -> bytes:
+    """Encode a JWT secret key once instead of inside PyJWT on every call."""
+    return secret_key.encode("utf-8")
+
+
+def _jwt_key() -> bytes:
+    """Get the signing key of the current app as bytes."""
+    return _encode_key(current_app.config["JWT_SECRET_KEY"])
 
 
 def register_user(username: str, email: str, password: str) -> Tuple[User, bool]:
@@ -40,12 +56,12 @@ def register_user(username: str, email: str, password: str) -> Tuple[User, bool]
         db.session.add(user)
         db.session.commit()
 
-        current_app.logger.info(f"User {username} registered successfully")
+        current_app.logger.info("User %s registered successfully", username)
 
         return user, True
     except IntegrityError:
         db.session.rollback()
-        current_app.logger.error(f"Failed to create user {username}")
+        current_app.logger.error("Failed to create user %s", username)
         raise abort(500, "Failed to create user")
 
 
@@ -60,11 +76,18 @@ def authenticate_user(username: str, password: str) -> Optional[User]:
     Returns:
         User object if authentication is successful, None otherwise
     """
-    user = (
-        db.Query(User)
-        .filter((User.username == username) | (User.email == username))
-        .first()
+    # Probe one unique index at a time instead of an OR across both columns,
+    # starting with the column the login most likely refers to
+    lookups = (
+        (get_user_by_email, get_user_by_username)
+        if "@" in username
+        else (get_user_by_username, get_user_by_email)
     )
+    user = None
+    for lookup in lookups:
+        user = lookup(username)
+        if user:
+            break
 
     if not user:
         return None
@@ -72,11 +95,15 @@ def authenticate_user(username: str, password: str) -> Optional[User]:
     if not user.check_password(password):
         return None
 
+    # Move the hash to the configured work factor, saved along with last_login
+    if needs_rehash(user.password_hash):
+        user.set_password(password)
+
     # Update last login timestamp
     user.update_last_login()
 
     current_app.logger.info(
-        f"User {username} authenticated successfully at {user.last_login}"
+        "User %s authenticated successfully at %s", username, user.last_login
     )
 
     return user
@@ -95,24 +122,23 @@ def create_access_token(
     Returns:
         JWT token string
     """
-    settings = get_settings()
-
+    # JWT_ACCESS_TOKEN_EXPIRES is configured in seconds
     if expires_delta is None:
-        expires_delta = timedelta(hours=settings.JWT_ACCESS_TOKEN_EXPIRES)
+        expires_in = current_app.config["JWT_ACCESS_TOKEN_EXPIRES"]
+    else:
+        expires_in = int(expires_delta.total_seconds())
 
-    expire = datetime.now(timezone.utc) + expires_delta
+    # Integer timestamps are what PyJWT would encode the datetimes to anyway
+    issued_at = int(time.time())
 
     payload = {
         "sub": str(user_id),
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": issued_at + expires_in,
+        "iat": issued_at,
         "type": "access",
     }
 
-    return jwt.encode(
-        payload,
-        settings.JWT_SECRET_KEY,
-    )
+    return jwt.encode(payload, _jwt_key(), algorithm=JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> Dict:
@@ -128,14 +154,35 @@ def decode_token(token: str) -> Dict:
     Raises:
         jwt.PyJWTError: If token is invalid
     """
-    settings = get_settings()
-    return jwt.decode(
-        token,
-        settings.JWT_SECRET_KEY,
-    )
+    payload = _decode_verified_token(token, _jwt_key())
+
+    # Cached payloads outlive their token, so expiry is checked on every call
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    return dict(payload)
 
 
-def get_current_user_id_from_token(token: str) -> Optional[int]:
+@lru_cache(maxsize=4096)
+def _decode_verified_token(token: str, secret_key: bytes) -> Dict:
+    """
+    Verify and decode a JWT token once per token and signing key.
+
+    Args:
+        token: JWT token string
+        secret_key: Key the token signature is checked against
+
+    Returns:
+        Decoded token payload
+
+    Raises:
+        jwt.PyJWTError: If token is invalid
+    """
+    return jwt.decode(token, secret_key, algorithms=[JWT_ALGORITHM])
+
+
+def get_current_user_id_from_token(token: str) -> Optional[UUID]:
     """
     Get the user ID from a token.
 
@@ -150,7 +197,7 @@ def get_current_user_id_from_token(token: str) -> Optional[int]:
         sub = payload.get("sub")
         if not sub:
             return None
-        return sub
+        return UUID(sub)
     except (jwt.PyJWTError, ValueError):
         return None
 
@@ -167,7 +214,6 @@ def get_current_user_from_token(token: str) -> Optional[User]:
     """
     user_id = get_current_user_id_from_token(token)
     if user_id:
-        user = db.Query(User).filter(User.id == user_id).first()
-        if user:
-            return user
+        # Served from the identity map when the user is already loaded
+        return db.session.get(User, user_id)
     return None
@@ -1,12 +1,36 @@
 """Category service functions."""
 from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
 from flask import abort, current_app
-from sqlalchemy import asc, desc
+from sqlalchemy import and_, asc, case, delete, desc, func, select, update
 
 from app.core.extensions import db
 from app.models import Category, Task
 from app.schemas.task import StatusEnum
+from app.services.pagination import paginate_query
+from app.utils.dates import today
+
+# Columns serialized by the list endpoint, loaded without ORM hydration
+LIST_COLUMNS = (
+    Category.id,
+    Category.name,
+    Category.description,
+    Category.user_id,
+    Category.created_at,
+    Category.updated_at,
+)
+
+# Columns the list endpoint may sort by
+SORT_COLUMNS = {
+    "name": Category.name,
+    "created_at": Category.created_at,
+    "updated_at": Category.updated_at,
+}
+SORT_DIRECTIONS = {"asc": asc, "desc": desc}
+
+# Fields the update endpoint may change
+UPDATABLE_FIELDS = frozenset({"name", "description"})
 
 
 def create_category(
@@ -28,11 +52,11 @@ def create_category(
     try:
         db.session.add(category)
         db.session.commit()
-        current_app.logger.info(f"Category {name} created successfully")
+        current_app.logger.info("Category %s created successfully", name)
         return category
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to create category {name}: {e}")
+        current_app.logger.error("Failed to create category %s: %s", name, e)
         raise abort(500, "Failed to create category")
 
 
@@ -47,55 +71,88 @@ def get_category_by_id(category_id: int, user_id: int) -> Optional[Category]:
     Returns:
         Category object if found, None otherwise
     """
-    return Category.query.filter_by(id=category_id, user_id=user_id).first()
+    return db.session.scalar(
+        select(Category).where(Category.id == category_id, Category.user_id == user_id)
+    )
 
 
-def update_category(category: Category, data: Dict[str, Any]) -> Category:
+def update_category(
+    category_id: UUID, user_id: UUID, data: Dict[str, Any]
+) -> Optional[Category]:
     """
-    Update a category.
+    Update a category owned by a user.
 
     Args:
-        category: Category object to update
+        category_id: Category ID
+        user_id: User ID
         data: Dictionary of category attributes to update
 
     Returns:
-        Updated category object
+        Updated category object if found, None otherwise
     """
-    for key, value in data.items():
-        if hasattr(category, key) and value is not None:
-            setattr(category, key, value)
+    values = {
+        key: value
+        for key, value in data.items()
+        if key in UPDATABLE_FIELDS and value is not None
+    }
+    if not values:
+        return get_category_by_id(category_id, user_id)
 
     try:
+        category = db.session.execute(
+            update(Category)
+            .where(Category.id == category_id, Category.user_id == user_id)
+            .values(**values)
+            .returning(Category)
+        ).scalar_one_or_none()
         db.session.commit()
-        current_app.logger.info(f"Category {category.name} updated successfully")
+        if category:
+            current_app.logger.info("Category %s updated successfully", category.name)
         return category
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to update category: {e}")
+        current_app.logger.error("Failed to update category: %s", e)
         raise abort(500, "Failed to update category")
 
 
-def delete_category(category: Category) -> bool:
+def delete_category(category_id: UUID, user_id: UUID) -> bool:
     """
-    Delete a category. This will remove the category from all tasks.
+    Delete a category owned by a user. This will remove the category from all tasks.
 
     Args:
-        category: Category object to delete
+        category_id: Category ID
+        user_id: User ID
 
     Returns:
-        True if deletion was successful
+        True if the category was deleted, False if it was not found
     """
-    # Delete the category
     try:
-        db.session.delete(category)
+        # Detach the category from its tasks
+        owned = select(Category.id).where(
+            Category.id == category_id, Category.user_id == user_id
+        )
+        db.session.execute(
+            update(Task).where(Task.category_id.in_(owned)).values(category_id=None)
+        )
+
+        # Delete the category
+        name = db.session.execute(
+            delete(Category)
+            .where(Category.id == category_id, Category.user_id == user_id)
+            .returning(Category.name)
+        ).scalar_one_or_none()
         db.session.commit()
-        current_app.logger.info(f"Category {category.name} deleted successfully")
-        return True
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to delete category: {e}")
+        current_app.logger.error("Failed to delete category: %s", e)
         raise abort(500, "Failed to delete category")
 
+    if name is None:
+        return False
+
+    current_app.logger.info("Category %s deleted successfully", name)
+    return True
+
 
 def list_categories(
     user_id: int,
@@ -103,7 +160,7 @@ def list_categories(
     sort_order: str = "asc",
     page: int = 1,
     per_page: int = 20,
-) -> Tuple[List[Category], int]:
+) -> Tuple[List[Dict[str, Any]], int]:
     """
     List categories for a user with pagination.
 
@@ -115,21 +172,16 @@ def list_categories(
         per_page: Number of items per page
 
     Returns:
-        Tuple of (list of categories, total count)
+        Tuple of (list of category dictionaries, total count)
     """
-    query = Category.query.filter_by(user_id=user_id)
+    query = db.session.query(*LIST_COLUMNS).filter(Category.user_id == user_id)
 
-    # Apply sorting
-    if hasattr(Category, sort_by):
-        sort_attr = getattr(Category, sort_by)
-        if sort_order == "desc":
-            query = query.order_by(desc(sort_attr))
-        else:
-            query = query.order_by(asc(sort_attr))
+    # Apply sorting, falling back to the name for unknown fields
+    sort_attr = SORT_COLUMNS.get(sort_by, Category.name)
+    query = query.order_by(SORT_DIRECTIONS.get(sort_order, asc)(sort_attr))
 
     # Apply pagination
-    total = query.count()
-    categories = query.offset((page - 1) * per_page).limit(per_page).all()
+    categories, total = paginate_query(query, page, per_page)
 
     return categories, total
 
@@ -144,41 +196,41 @@ def get_category_stats(user_id: int) -> List[Dict[str, Any]]:
     Returns:
         List of category statistics
     """
-    from datetime import datetime
-
-    today = datetime.now().date()
-
-    categories = Category.query.filter_by(user_id=user_id).all()
-    result = []
-
-    for category in categories:
-        # Get tasks in this category
-        tasks = Task.query.filter_by(user_id=user_id, category_id=category.id).all()
-
-        # Count total, completed, and overdue tasks
-        task_count = len(tasks)
-        completed_count = sum(1 for task in tasks if task.status == StatusEnum.READY)
-        overdue_count = sum(
-            1
-            for task in tasks
-            if task.due_date
-            and task.due_date < today
-            and task.status != StatusEnum.READY
+    is_ready = Task.status == StatusEnum.READY
+    is_overdue = and_(Task.due_date < today(), Task.status != StatusEnum.READY)
+
+    # Count every category's tasks in one grouped pass over the task table
+    counts = (
+        select(
+            Task.category_id,
+            func.count().label("task_count"),
+            func.sum(case((is_ready, 1), else_=0)).label("completed_count"),
+            func.sum(case((is_overdue, 1), else_=0)).label("overdue_count"),
         )
-
-        # Create stats dictionary
-        stats = category.to_dict()
-        stats.update(
-            {
-                "task_count": task_count,
-                "completed_count": completed_count,
-                "overdue_count": overdue_count,
-                "completion_rate": round((completed_count / task_count * 100), 2)
-                if task_count > 0
-                else 100.0,
-            }
+        .where(Task.user_id == user_id, Task.category_id.is_not(None))
+        .group_by(Task.category_id)
+        .subquery()
+    )
+    query = (
+        select(
+            *LIST_COLUMNS,
+            func.coalesce(counts.c.task_count, 0).label("task_count"),
+            func.coalesce(counts.c.completed_count, 0).label("completed_count"),
+            func.coalesce(counts.c.overdue_count, 0).label("overdue_count"),
         )
+        .outerjoin(counts, counts.c.category_id == Category.id)
+        .where(Category.user_id == user_id)
+    )
 
+    result = []
+    for row in db.session.execute(query):
+        stats = row._asdict()
+        task_count = stats["task_count"]
+        stats["completion_rate"] = (
+            round((stats["completed_count"] / task_count * 100), 2)
+            if task_count > 0
+            else 100.0
+        )
         result.append(stats)
 
     return result
@@ -0,0 +1,124 @@
+"""Pagination helpers for service queries."""
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from flask import abort
+from sqlalchemy import func, tuple_
+
+
+def paginate_query(query: Any, page: int, per_page: int) -> Tuple[List[Any], int]:
+    """
+    Fetch one page of a query together with the total number of matches.
+
+    The total is computed with a ``COUNT(*) OVER ()`` window column, so the
+    page and the count come back in a single round trip.
+
+    Queries selecting a single entity return the entities, queries selecting
+    several columns return one dictionary per row keyed by column name.
+
+    Args:
+        query: Query selecting an entity or a set of columns
+        page: Page number
+        per_page: Number of items per page
+
+    Returns:
+        Tuple of (list of items, total count)
+    """
+    names = [column["name"] for column in query.column_descriptions]
+    rows = (
+        query.add_columns(func.count().over().label("total"))
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+        .all()
+    )
+
+    if not rows:
+        # An empty page past the end still needs the real total
+        return [], query.count() if page > 1 else 0
+
+    if len(names) == 1:
+        items = [row[0] for row in rows]
+    else:
+        items = [dict(zip(names, row)) for row in rows]
+
+    return items, rows[0].total
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+
+    Args:
+        created_at: Creation time of the row
+        id: ID of the row, breaking ties between rows created at the same time
+
+    Returns:
+        URL safe cursor string
+    """
+    key = orjson.dumps({"created_at": created_at, "id": id})
+    return base64.urlsafe_b64encode(key).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor built by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (creation time, ID) of the last row of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor + "=="))
+        return datetime.fromisoformat(key["created_at"]), UUID(key["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def paginate_by_cursor(
+    query: Any, model: Any, cursor: Optional[str], per_page: int
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch the page of a query that follows a cursor, newest rows first.
+
+    Rows are ordered and filtered on ``(created_at, id)``, so deep pages seek
+    past the previous page instead of skipping an OFFSET, and no total is
+    counted. Rows created in the same instant are ordered by ID.
+
+    Args:
+        query: Query selecting a model or its columns, without an ORDER BY
+        model: Model providing the created_at and id columns
+        cursor: Cursor returned with the previous page, None for the first page
+        per_page: Number of items per page, at least 1
+
+    Returns:
+        Tuple of (list of items, cursor of the next page or None on the last page)
+    """
+    if per_page < 1:
+        abort(400, "per_page must be at least 1")
+
+    if cursor:
+        try:
+            created_at, id = decode_cursor(cursor)
+        except ValueError:
+            abort(400, "Invalid cursor")
+        query = query.filter(tuple_(model.created_at, model.id) < (created_at, id))
+
+    # One extra row tells whether another page follows
+    items = (
+        query.order_by(model.created_at.desc(), model.id.desc())
+        .limit(per_page + 1)
+        .all()
+    )
+    if len(items) <= per_page:
+        return items, None
+
+    items = items[:per_page]
+    return items, encode_cursor(items[-1].created_at, items[-1].id)
@@ -3,10 +3,31 @@ from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from flask import abort, current_app
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, delete, desc, func, select, update
 
 from app.core.extensions import db
 from app.models import Tag, TaskTag
+from app.services.pagination import paginate_query
+
+# Columns serialized by the list endpoint, loaded without ORM hydration
+LIST_COLUMNS = (
+    Tag.id,
+    Tag.name,
+    Tag.user_id,
+    Tag.created_at,
+    Tag.updated_at,
+)
+
+# Columns the list endpoint may sort by
+SORT_COLUMNS = {
+    "name": Tag.name,
+    "created_at": Tag.created_at,
+    "updated_at": Tag.updated_at,
+}
+SORT_DIRECTIONS = {"asc": asc, "desc": desc}
+
+# Fields the update endpoint may change
+UPDATABLE_FIELDS = frozenset({"name"})
 
 
 def create_tag(user_id: UUID, name: str) -> Tag:
@@ -26,11 +47,11 @@ def create_tag(user_id: UUID, name: str) -> Tag:
         db.session.add(tag)
         db.session.commit()
 
-        current_app.logger.info(f"Tag {name} created successfully")
+        current_app.logger.info("Tag %s created successfully", name)
         return tag
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to create tag {name}: {e}")
+        current_app.logger.error("Failed to create tag %s: %s", name, e)
         raise abort(500, "Failed to create tag")
 
 
@@ -45,7 +66,27 @@ def get_tag_by_id(tag_id: UUID, user_id: UUID) -> Optional[Tag]:
     Returns:
         Tag object if found, None otherwise
     """
-    return Tag.query.filter_by(id=tag_id, user_id=user_id).first()
+    return db.session.scalar(
+        select(Tag).where(Tag.id == tag_id, Tag.user_id == user_id)
+    )
+
+
+def get_tags_by_ids(tag_ids: List[UUID], user_id: UUID) -> List[Tag]:
+    """
+    Get the tags of a user matching a list of IDs in a single query.
+
+    Args:
+        tag_ids: Tag IDs
+        user_id: User ID
+
+    Returns:
+        List of the tags found, IDs of missing or foreign tags are skipped
+    """
+    if not tag_ids:
+        return []
+    return db.session.scalars(
+        select(Tag).where(Tag.id.in_(set(tag_ids)), Tag.user_id == user_id)
+    ).all()
 
 
 def get_tag_by_name(name: str, user_id: int) -> Optional[Tag]:
@@ -59,55 +100,82 @@ def get_tag_by_name(name: str, user_id: int) -> Optional[Tag]:
     Returns:
         Tag object if found, None otherwise
     """
-    return Tag.query.filter_by(name=name, user_id=user_id).first()
+    return db.session.scalar(
+        select(Tag).where(Tag.name == name, Tag.user_id == user_id)
+    )
 
 
-def update_tag(tag: Tag, data: Dict[str, Any]) -> Tag:
+def update_tag(tag_id: UUID, user_id: UUID, data: Dict[str, Any]) -> Optional[Tag]:
     """
-    Update a tag.
+    Update a tag owned by a user.
 
     Args:
-        tag: Tag object to update
+        tag_id: Tag ID
+        user_id: User ID
         data: Dictionary of tag attributes to update
 
     Returns:
-        Updated tag object
+        Updated tag object if found, None otherwise
     """
-    for key, value in data.items():
-        if hasattr(tag, key) and value is not None:
-            setattr(tag, key, value)
+    values = {
+        key: value
+        for key, value in data.items()
+        if key in UPDATABLE_FIELDS and value is not None
+    }
+    if not values:
+        return get_tag_by_id(tag_id, user_id)
 
     try:
+        tag = db.session.execute(
+            update(Tag)
+            .where(Tag.id == tag_id, Tag.user_id == user_id)
+            .values(**values)
+            .returning(Tag)
+        ).scalar_one_or_none()
         db.session.commit()
-        current_app.logger.info(f"Tag {tag.name} updated successfully")
+        if tag:
+            current_app.logger.info("Tag %s updated successfully", tag.name)
         return tag
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to update tag: {e}")
+        current_app.logger.error("Failed to update tag: %s", e)
         raise abort(500, "Failed to update tag")
 
 
-def delete_tag(tag: Tag) -> bool:
+def delete_tag(tag_id: UUID, user_id: UUID) -> bool:
     """
-    Delete a tag. This will remove the tag from all tasks.
+    Delete a tag owned by a user. This will remove the tag from all tasks.
 
     Args:
-        tag: Tag object to delete
+        tag_id: Tag ID
+        user_id: User ID
 
     Returns:
-        True if deletion was successful
+        True if the tag was deleted, False if it was not found
     """
-    # The cascade should handle removing the tag from all tasks
     try:
-        db.session.delete(tag)
+        # Remove the tag from all tasks
+        owned = select(Tag.id).where(Tag.id == tag_id, Tag.user_id == user_id)
+        db.session.execute(delete(TaskTag).where(TaskTag.tag_id.in_(owned)))
+
+        # Delete the tag
+        name = db.session.execute(
+            delete(Tag)
+            .where(Tag.id == tag_id, Tag.user_id == user_id)
+            .returning(Tag.name)
+        ).scalar_one_or_none()
         db.session.commit()
-        current_app.logger.info(f"Tag {tag.name} deleted successfully")
-        return True
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to delete tag: {e}")
+        current_app.logger.error("Failed to delete tag: %s", e)
         raise abort(500, "Failed to delete tag")
 
+    if name is None:
+        return False
+
+    current_app.logger.info("Tag %s deleted successfully", name)
+    return True
+
 
 def list_tags(
     user_id: int,
@@ -115,7 +183,7 @@ def list_tags(
     sort_order: str = "asc",
     page: int = 1,
     per_page: int = 20,
-) -> Tuple[List[Tag], int]:
+) -> Tuple[List[Dict[str, Any]], int]:
     """
     List tags for a user with pagination.
 
@@ -127,21 +195,16 @@ def list_tags(
         per_page: Number of items per page
 
     Returns:
-        Tuple of (list of tags, total count)
+        Tuple of (list of tag dictionaries, total count)
     """
-    query = Tag.query.filter_by(user_id=user_id)
+    query = db.session.query(*LIST_COLUMNS).filter(Tag.user_id == user_id)
 
-    # Apply sorting
-    if hasattr(Tag, sort_by):
-        sort_attr = getattr(Tag, sort_by)
-        if sort_order == "desc":
-            query = query.order_by(desc(sort_attr))
-        else:
-            query = query.order_by(asc(sort_attr))
+    # Apply sorting, falling back to the name for unknown fields
+    sort_attr = SORT_COLUMNS.get(sort_by, Tag.name)
+    query = query.order_by(SORT_DIRECTIONS.get(sort_order, asc)(sort_attr))
 
     # Apply pagination
-    total = query.count()
-    tags = query.offset((page - 1) * per_page).limit(per_page).all()
+    tags, total = paginate_query(query, page, per_page)
 
     return tags, total
 
@@ -154,23 +217,22 @@ def get_tag_stats(user_id: int) -> List[Dict[str, Any]]:
         user_id: User ID
 
     Returns:
-        List of tag statistics with usage counts
+        List of tag statistics with usage counts, most used first
     """
-    # First get all tags for this user
-    tags = Tag.query.filter_by(user_id=user_id).all()
-    result = []
-
-    for tag in tags:
-        # Count tasks that use this tag
-        task_count = TaskTag.query.filter_by(tag_id=tag.id).count()
-
-        # Create stats dictionary
-        stats = tag.to_dict()
-        stats.update({"task_count": task_count})
-
-        result.append(stats)
-
-    # Sort by task_count (most used first)
-    result.sort(key=lambda x: x["task_count"], reverse=True)
-
-    return result
+    # Count every tag's tasks in one grouped pass over the association table
+    counts = (
+        select(TaskTag.tag_id, func.count().label("task_count"))
+        .join(Tag, Tag.id == TaskTag.tag_id)
+        .where(Tag.user_id == user_id)
+        .group_by(TaskTag.tag_id)
+        .subquery()
+    )
+    task_count = func.coalesce(counts.c.task_count, 0).label("task_count")
+    query = (
+        select(*LIST_COLUMNS, task_count)
+        .outerjoin(counts, counts.c.tag_id == Tag.id)
+        .where(Tag.user_id == user_id)
+        .order_by(task_count.desc())
+    )
+
+    return [row._asdict() for row in db.session.execute(query)]
@@ -1,14 +1,46 @@
 """Task service functions."""
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from flask import abort, current_app
-from sqlalchemy import and_, asc, desc, or_
+from sqlalchemy import (
+    and_,
+    asc,
+    bindparam,
+    case,
+    delete,
+    desc,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.sql import Select
 
 from app.core.extensions import db
 from app.models import Task, TaskTag
 from app.schemas.task import StatusEnum
+from app.services.pagination import paginate_by_cursor, paginate_query
+from app.services.tag import get_tag_by_id, get_tags_by_ids
+from app.utils.dates import today
+
+# Columns the search endpoint may sort by
+SORT_COLUMNS = {
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "due_date": Task.due_date,
+    "priority": Task.priority,
+    "status": Task.status,
+    "title": Task.title,
+}
+SORT_DIRECTIONS = {"asc": asc, "desc": desc}
+
+# Fields the update endpoint may change, tags are handled separately
+UPDATABLE_FIELDS = frozenset(
+    {"title", "description", "status", "priority", "due_date", "category_id"}
+)
 
 
 def create_task(
@@ -52,19 +84,15 @@ def create_task(
 
         # Add task tags if provided
         if tag_ids:
-            for tag_id in tag_ids:
-                from .tag import get_tag_by_id
-
-                tag = get_tag_by_id(tag_id, user_id)
-                if tag:
-                    task.add_tag(tag)
+            for tag in get_tags_by_ids(tag_ids, user_id):
+                task.add_tag(tag)
 
         db.session.commit()
-        current_app.logger.info(f"Task {title} created successfully")
+        current_app.logger.info("Task %s created successfully", title)
         return task
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to create task {title}: {e}")
+        current_app.logger.error("Failed to create task %s: %s", title, e)
         raise abort(500, "Failed to create task")
 
 
@@ -79,72 +107,100 @@ def get_task_by_id(task_id: UUID, user_id: int) -> Optional[Task]:
     Returns:
         Task object if found, None otherwise
     """
-    return Task.query.filter_by(id=task_id, user_id=user_id).first()
+    # Served from the identity map when the task is already loaded
+    task = db.session.get(Task, task_id)
+    if task is None or task.user_id != user_id:
+        return None
+    return task
 
 
-def update_task(task: Task, data: Dict[str, Any]) -> Task:
+def update_task(task_id: UUID, user_id: UUID, data: Dict[str, Any]) -> Optional[Task]:
     """
-    Update a task.
+    Update a task owned by a user.
 
     Args:
-        task: Task object to update
+        task_id: Task ID
+        user_id: User ID
         data: Dictionary of task attributes to update
 
     Returns:
-        Updated task object
+        Updated task object if found, None otherwise
     """
     # Handle tag_ids separately
     tag_ids = data.pop("tag_ids", None)
+    values = {
+        key: value
+        for key, value in data.items()
+        if key in UPDATABLE_FIELDS and value is not None
+    }
 
     try:
         # Update task attributes
-        for key, value in data.items():
-            if hasattr(task, key) and value is not None:
-                setattr(task, key, value)
+        if values:
+            task = db.session.execute(
+                update(Task)
+                .where(Task.id == task_id, Task.user_id == user_id)
+                .values(**values)
+                .returning(Task)
+            ).scalar_one_or_none()
+        else:
+            task = get_task_by_id(task_id, user_id)
+
+        if task is None:
+            return None
 
         # Update tags if provided
         if tag_ids is not None:
             # Clear existing tags
-            for task_tag in task.task_tags:
-                db.session.delete(task_tag)
+            db.session.execute(delete(TaskTag).where(TaskTag.task_id == task.id))
 
             # Add new tags
-            from .tag import get_tag_by_id
-
-            for tag_id in tag_ids:
-                tag = get_tag_by_id(tag_id, task.user_id)
-                if tag:
-                    task.add_tag(tag)
+            for tag in get_tags_by_ids(tag_ids, user_id):
+                task.add_tag(tag)
 
         db.session.commit()
-        current_app.logger.info(f"Task {task.title} updated successfully")
+        current_app.logger.info("Task %s updated successfully", task.title)
         return task
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to update task: {e}")
+        current_app.logger.error("Failed to update task: %s", e)
         raise abort(500, "Failed to update task")
 
 
-def delete_task(task: Task) -> bool:
+def delete_task(task_id: UUID, user_id: UUID) -> bool:
     """
-    Delete a task.
+    Delete a task owned by a user.
 
     Args:
-        task: Task object to delete
+        task_id: Task ID
+        user_id: User ID
 
     Returns:
-        True if deletion was successful
+        True if the task was deleted, False if it was not found
     """
     try:
-        db.session.delete(task)
+        # Remove the task's tag associations
+        owned = select(Task.id).where(Task.id == task_id, Task.user_id == user_id)
+        db.session.execute(delete(TaskTag).where(TaskTag.task_id.in_(owned)))
+
+        # Delete the task
+        title = db.session.execute(
+            delete(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .returning(Task.title)
+        ).scalar_one_or_none()
         db.session.commit()
-        current_app.logger.info(f"Task {task.title} deleted successfully")
-        return True
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to delete task: {e}")
+        current_app.logger.error("Failed to delete task: %s", e)
         raise abort(500, "Failed to delete task")
 
+    if title is None:
+        return False
+
+    current_app.logger.info("Task %s deleted successfully", title)
+    return True
+
 
 def list_tasks(
     user_id: int, page: int = 1, per_page: int = 20
@@ -161,11 +217,78 @@ def list_tasks(
         Tuple of (list of tasks, total count)
     """
     query = Task.query.filter_by(user_id=user_id).order_by(Task.created_at.desc())
-    total = query.count()
-    tasks = query.offset((page - 1) * per_page).limit(per_page).all()
+    tasks, total = paginate_query(query, page, per_page)
     return tasks, total
 
 
+def list_tasks_by_cursor(
+    user_id: UUID, cursor: Optional[str] = None, per_page: int = 20
+) -> Tuple[List[Task], Optional[str]]:
+    """
+    List tasks for a user, newest first, with cursor pagination.
+
+    Args:
+        user_id: User ID
+        cursor: Cursor returned with the previous page, None for the first page
+        per_page: Number of items per page
+
+    Returns:
+        Tuple of (list of tasks, cursor of the next page)
+    """
+    query = Task.query.filter_by(user_id=user_id)
+    return paginate_by_cursor(query, Task, cursor, per_page)
+
+
+def _filter_tasks(
+    query: Any,
+    title: Optional[str] = None,
+    status: Optional[StatusEnum] = None,
+    priority: Optional[Any] = None,
+    category_id: Optional[int] = None,
+    tag_ids: Optional[List[int]] = None,
+    is_overdue: Optional[bool] = None,
+    due_date_from: Optional[date] = None,
+    due_date_to: Optional[date] = None,
+) -> Any:
+    """Apply the task search filters to a query."""
+    if title:
+        query = query.filter(Task.title.ilike(f"%{title}%"))
+
+    if status:
+        query = query.filter(Task.status == status)
+
+    if priority:
+        query = query.filter(Task.priority == priority)
+
+    if category_id:
+        query = query.filter(Task.category_id == category_id)
+
+    if tag_ids:
+        # A semi-join, so tasks with several matching tags are returned once
+        query = query.filter(
+            Task.id.in_(select(TaskTag.task_id).where(TaskTag.tag_id.in_(tag_ids)))
+        )
+
+    if is_overdue is not None:
+        current_date = today()
+        if is_overdue:
+            query = query.filter(
+                and_(Task.due_date.isnot(None), Task.due_date < current_date)
+            )
+        else:
+            query = query.filter(
+                or_(Task.due_date.is_(None), Task.due_date >= current_date)
+            )
+
+    if due_date_from:
+        query = query.filter(Task.due_date >= due_date_from)
+
+    if due_date_to:
+        query = query.filter(Task.due_date <= due_date_to)
+
+    return query
+
+
 def search_tasks(
     user_id: int,
     title: Optional[str] = None,
@@ -202,52 +325,48 @@ def search_tasks(
     Returns:
         Tuple of (list of tasks, total count)
     """
-    query = Task.query.filter_by(user_id=user_id)
-
-    # Apply filters
-    if title:
-        query = query.filter(Task.title.ilike(f"%{title}%"))
-
-    if status:
-        query = query.filter(Task.status == status)
-
-    if priority:
-        query = query.filter(Task.priority == priority)
-
-    if category_id:
-        query = query.filter(Task.category_id == category_id)
+    query = _filter_tasks(
+        Task.query.filter_by(user_id=user_id),
+        title=title,
+        status=status,
+        priority=priority,
+        category_id=category_id,
+        tag_ids=tag_ids,
+        is_overdue=is_overdue,
+        due_date_from=due_date_from,
+        due_date_to=due_date_to,
+    )
 
-    if tag_ids:
-        query = query.join(Task.task_tags).filter(
-            Task.task_tags.any(TaskTag.tag_id.in_(tag_ids))
-        )
+    # Apply sorting, falling back to the creation date for unknown fields
+    sort_attr = SORT_COLUMNS.get(sort_by, Task.created_at)
+    query = query.order_by(SORT_DIRECTIONS.get(sort_order, desc)(sort_attr))
 
-    if is_overdue is not None:
-        today = datetime.now().date()
-        if is_overdue:
-            query = query.filter(and_(Task.due_date.isnot(None), Task.due_date < today))
-        else:
-            query = query.filter(or_(Task.due_date.is_(None), Task.due_date >= today))
+    # Apply pagination
+    tasks, total = paginate_query(query, page, per_page)
 
-    if due_date_from:
-        query = query.filter(Task.due_date >= due_date_from)
+    return tasks, total
 
-    if due_date_to:
-        query = query.filter(Task.due_date <= due_date_to)
 
-    # Apply sorting
-    if hasattr(Task, sort_by):
-        sort_attr = getattr(Task, sort_by)
-        if sort_order == "desc":
-            query = query.order_by(desc(sort_attr))
-        else:
-            query = query.order_by(asc(sort_attr))
+def search_tasks_by_cursor(
+    user_id: UUID,
+    cursor: Optional[str] = None,
+    per_page: int = 20,
+    **filters: Any,
+) -> Tuple[List[Task], Optional[str]]:
+    """
+    Search tasks with filters, newest first, with cursor pagination.
 
-    # Apply pagination
-    total = query.count()
-    tasks = query.offset((page - 1) * per_page).limit(per_page).all()
+    Args:
+        user_id: User ID
+        cursor: Cursor returned with the previous page, None for the first page
+        per_page: Number of items per page
+        **filters: Filters accepted by search_tasks
 
-    return tasks, total
+    Returns:
+        Tuple of (list of tasks, cursor of the next page)
+    """
+    query = _filter_tasks(Task.query.filter_by(user_id=user_id), **filters)
+    return paginate_by_cursor(query, Task, cursor, per_page)
 
 
 def add_tag_to_task(task: Task, tag_id: UUID) -> bool:
@@ -261,8 +380,6 @@ def add_tag_to_task(task: Task, tag_id: UUID) -> bool:
     Returns:
         True if tag was added successfully
     """
-    from .tag import get_tag_by_id
-
     tag = get_tag_by_id(tag_id, task.user_id)
     if not tag:
         return False
@@ -283,8 +400,6 @@ def remove_tag_from_task(task: Task, tag_id: UUID) -> bool:
     Returns:
         True if tag was removed successfully
     """
-    from .tag import get_tag_by_id
-
     tag = get_tag_by_id(tag_id, task.user_id)
     if not tag:
         return False
@@ -294,6 +409,22 @@ def remove_tag_from_task(task: Task, tag_id: UUID) -> bool:
     return True
 
 
+@lru_cache(maxsize=None)
+def _task_stats_query() -> Select:
+    """Build the task statistics query once, user_id and today are bound per call."""
+    current_date = bindparam("today")
+    is_ready = Task.status == StatusEnum.READY
+    is_overdue = and_(Task.due_date < current_date, Task.status != StatusEnum.READY)
+
+    # Count everything in one pass, COUNT skipping the NULLs of unmatched rows
+    return select(
+        func.count().label("total_tasks"),
+        func.count(case((is_ready, 1))).label("completed_tasks"),
+        func.count(case((is_overdue, 1))).label("overdue_tasks"),
+        func.count(case((Task.due_date == current_date, 1))).label("due_today"),
+    ).where(Task.user_id == bindparam("user_id"))
+
+
 def get_task_stats(user_id: int) -> Dict[str, Any]:
     """
     Get task statistics for a user.
@@ -304,19 +435,10 @@ def get_task_stats(user_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary of task statistics
     """
-    total_tasks = Task.query.filter_by(user_id=user_id).count()
-    completed_tasks = Task.query.filter_by(
-        user_id=user_id, status=StatusEnum.READY
-    ).count()
-
-    today = datetime.now().date()
-    overdue_tasks = Task.query.filter(
-        Task.user_id == user_id, Task.due_date < today, Task.status != StatusEnum.READY
-    ).count()
-
-    due_today = Task.query.filter(
-        Task.user_id == user_id, Task.due_date == today
-    ).count()
+    counts = db.session.execute(
+        _task_stats_query(), {"user_id": user_id, "today": today()}
+    ).one()
+    total_tasks, completed_tasks, overdue_tasks, due_today = counts
 
     return {
         "total_tasks": total_tasks,
@@ -1,11 +1,39 @@
 """User service functions."""
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
 from flask import abort, current_app
-from sqlalchemy import or_
+from sqlalchemy import bindparam, or_, select
 
 from app.core.extensions import db
 from app.models.user import User
+from app.services.pagination import paginate_by_cursor, paginate_query
+
+# Columns returned by the list endpoint, read as rows without loading models
+LIST_COLUMNS = (
+    User.id,
+    User.username,
+    User.email,
+    User.role,
+    User.created_at,
+    User.updated_at,
+    User.last_login,
+)
+
+# Fields the update endpoint may change besides the password
+UPDATABLE_FIELDS = frozenset({"username", "email"})
+
+# Lookup statements built once, only their bound values change per call
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+USER_EXISTS = select(User.id).where(User.id == bindparam("user_id"))
+USER_BY_USERNAME_OR_EMAIL = (
+    select(User)
+    .where(
+        or_(User.username == bindparam("username"), User.email == bindparam("email"))
+    )
+    .limit(1)
+)
 
 
 def get_user_by_id(user_id: int) -> Optional[User]:
@@ -18,7 +46,20 @@ def get_user_by_id(user_id: int) -> Optional[User]:
     Returns:
         User object if found, None otherwise
     """
-    return User.query.get(user_id)
+    return db.session.get(User, user_id)
+
+
+def user_exists(user_id: UUID) -> bool:
+    """
+    Check that a user exists without loading it.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        True if the user exists, False otherwise
+    """
+    return db.session.execute(USER_EXISTS, {"user_id": user_id}).first() is not None
 
 
 def get_user_by_username(username: str) -> Optional[User]:
@@ -31,7 +72,7 @@ def get_user_by_username(username: str) -> Optional[User]:
     Returns:
         User object if found, None otherwise
     """
-    return User.query.filter_by(username=username).first()
+    return db.session.scalar(USER_BY_USERNAME, {"username": username})
 
 
 def get_user_by_email(email: str) -> Optional[User]:
@@ -44,7 +85,7 @@ def get_user_by_email(email: str) -> Optional[User]:
     Returns:
         User object if found, None otherwise
     """
-    return User.query.filter_by(email=email).first()
+    return db.session.scalar(USER_BY_EMAIL, {"email": email})
 
 
 def get_user_by_username_or_email(username: str, email: str) -> Optional[User]:
@@ -58,9 +99,9 @@ def get_user_by_username_or_email(username: str, email: str) -> Optional[User]:
     Returns:
         User object if found, None otherwise
     """
-    return User.query.filter(
-        or_(User.username == username, User.email == email)
-    ).first()
+    return db.session.scalar(
+        USER_BY_USERNAME_OR_EMAIL, {"username": username, "email": email}
+    )
 
 
 def update_user(user: User, data: Dict[str, Any]) -> User:
@@ -80,18 +121,18 @@ def update_user(user: User, data: Dict[str, Any]) -> User:
             user.set_password(data["password"])
             del data["password"]
 
-        # Update other fields
+        # Update other fields, the user is loaded so only changed columns are written
         for key, value in data.items():
-            if hasattr(user, key) and value is not None:
+            if key in UPDATABLE_FIELDS and value is not None:
                 setattr(user, key, value)
 
-        current_app.logger.info(f"User {user.username} updated successfully")
+        current_app.logger.info("User %s updated successfully", user.username)
 
         db.session.commit()
         return user
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to update user {user.username}: {e}")
+        current_app.logger.error("Failed to update user %s: %s", user.username, e)
         raise abort(500, "Failed to update user")
 
 
@@ -108,15 +149,15 @@ def delete_user(user: User) -> bool:
     try:
         db.session.delete(user)
         db.session.commit()
-        current_app.logger.info(f"User {user.username} deleted successfully")
+        current_app.logger.info("User %s deleted successfully", user.username)
         return True
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Failed to delete user {user.username}: {e}")
+        current_app.logger.error("Failed to delete user %s: %s", user.username, e)
         raise abort(500, "Failed to delete user")
 
 
-def list_users(page: int = 1, per_page: int = 20) -> tuple[List[User], int]:
+def list_users(page: int = 1, per_page: int = 20) -> Tuple[List[Dict[str, Any]], int]:
     """
     List users with pagination.
 
@@ -125,9 +166,26 @@ def list_users(page: int = 1, per_page: int = 20) -> tuple[List[User], int]:
         per_page: Number of items per page
 
     Returns:
-        Tuple of (list of users, total count)
+        Tuple of (list of user dictionaries, total count)
     """
-    query = User.query.order_by(User.created_at.desc())
-    total = query.count()
-    users = query.offset((page - 1) * per_page).limit(per_page).all()
+    query = db.session.query(*LIST_COLUMNS).order_by(User.created_at.desc())
+    users, total = paginate_query(query, page, per_page)
     return users, total
+
+
+def list_users_by_cursor(
+    cursor: Optional[str] = None, per_page: int = 20
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    List users, newest first, with cursor pagination.
+
+    Args:
+        cursor: Cursor returned with the previous page, None for the first page
+        per_page: Number of items per page
+
+    Returns:
+        Tuple of (list of user dictionaries, cursor of the next page)
+    """
+    query = db.session.query(*LIST_COLUMNS)
+    rows, next_cursor = paginate_by_cursor(query, User, cursor, per_page)
+    return [row._asdict() for row in rows], next_cursor
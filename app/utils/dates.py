@@ -0,0 +1,36 @@
+"""Date helpers shared across a request."""
+from contextvars import ContextVar
+from datetime import date
+from typing import Optional
+
+# Today's date, resolved once per request
+_today: ContextVar[Optional[date]] = ContextVar("today", default=None)
+
+
+def today() -> date:
+    """
+    Get today's date, reusing the value cached for the current request.
+
+    Returns:
+        Today's date
+    """
+    return _today.get() or date.today()
+
+
+def register_request_date(app):
+    """
+    Cache today's date for the duration of each request.
+
+    Args:
+        app: Flask application instance
+    """
+
+    @app.before_request
+    def cache_today():
+        """Resolve today's date once for the request."""
+        _today.set(date.today())
+
+    @app.teardown_request
+    def clear_today(exc):
+        """Drop the cached date so it never outlives the request."""
+        _today.set(None)
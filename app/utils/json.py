@@ -0,0 +1,42 @@
+"""JSON serialization for the TasksService API."""
+import dataclasses
+import decimal
+
+import orjson
+from flask.json.provider import JSONProvider
+
+# UUIDs, datetimes and enums are serialized natively by orjson
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(o):
+    """Serialize types that orjson does not support natively."""
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumpb(obj) -> bytes:
+    """Serialize data as JSON encoded bytes."""
+    return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as a JSON string."""
+        return dumpb(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Serialize the arguments into an ``application/json`` response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumpb(obj), mimetype="application/json")
@@ -1,8 +1,42 @@
 """Logging configuration for the TasksService API."""
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+# Name marking the console handler added by configure_logging
+CONSOLE_HANDLER = "tasksservice.console"
+
+# Background file writer, shared by every app created in the process
+_listener: Optional[QueueListener] = None
+
+
+def _file_log_queue(formatter: logging.Formatter) -> queue.SimpleQueue:
+    """
+    Start the file logging listener once per process and return its queue.
+
+    Args:
+        formatter: Formatter of the file handler
+
+    Returns:
+        Queue drained by the listener thread
+    """
+    global _listener
+    if _listener is None:
+        file_handler = RotatingFileHandler(
+            "logs/tasksservice.log", maxBytes=10485760, backupCount=10  # 10MB
+        )
+        file_handler.setFormatter(formatter)
+
+        _listener = QueueListener(
+            queue.SimpleQueue(), file_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(_listener.stop)
+    return _listener.queue
 
 
 def configure_logging(app):
@@ -29,17 +63,16 @@ def configure_logging(app):
     # Configure Flask logger
     app.logger.setLevel(level)
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    app.logger.addHandler(console_handler)
+    # Console handler, attached once however many times the factory runs
+    if not any(h.name == CONSOLE_HANDLER for h in app.logger.handlers):
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.set_name(CONSOLE_HANDLER)
+        console_handler.setFormatter(formatter)
+        app.logger.addHandler(console_handler)
 
-    # File handler
-    file_handler = RotatingFileHandler(
-        "logs/tasksservice.log", maxBytes=10485760, backupCount=10  # 10MB
-    )
-    file_handler.setFormatter(formatter)
-    app.logger.addHandler(file_handler)
+    # Write the file from a background thread so requests never wait on disk
+    if not any(isinstance(h, QueueHandler) for h in app.logger.handlers):
+        app.logger.addHandler(QueueHandler(_file_log_queue(formatter)))
 
     # SQLAlchemy logging
     if level == logging.DEBUG:
@@ -0,0 +1,61 @@
+"""Response helpers for the TasksService API."""
+from typing import Any, List, Optional
+
+from flask import Response, current_app
+
+from app.utils.json import dumpb
+
+
+def paginated(items: List[Any], page: int, per_page: int, total: int) -> Response:
+    """
+    Build the JSON response for a page of a list endpoint.
+
+    Args:
+        items: Serialized items of the current page
+        page: Current page number
+        per_page: Number of items per page
+        total: Total number of items
+
+    Returns:
+        JSON response with the pagination envelope
+    """
+    return current_app.response_class(
+        dumpb(
+            {
+                "status": "success",
+                "data": items,
+                "page": page,
+                "per_page": per_page,
+                "total": total,
+                "pages": -(-total // per_page),
+            }
+        ),
+        mimetype="application/json",
+    )
+
+
+def cursor_paginated(
+    items: List[Any], per_page: int, next_cursor: Optional[str]
+) -> Response:
+    """
+    Build the JSON response for a cursor paginated page of a list endpoint.
+
+    Args:
+        items: Serialized items of the current page
+        per_page: Number of items per page
+        next_cursor: Cursor of the next page, None on the last page
+
+    Returns:
+        JSON response with the cursor pagination envelope
+    """
+    return current_app.response_class(
+        dumpb(
+            {
+                "status": "success",
+                "data": items,
+                "per_page": per_page,
+                "next_cursor": next_cursor,
+            }
+        ),
+        mimetype="application/json",
+    )
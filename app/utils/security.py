@@ -1,21 +1,86 @@
 """Security utilities for the TasksService API."""
+import sys
+from typing import Optional
+
 import bcrypt
+from flask import current_app, has_app_context
 from flask_jwt_extended import create_access_token, get_jwt_identity
 
+# bcrypt's own default, used outside an application context
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+def _run_blocking(func, *args):
+    """
+    Run a CPU bound call without stalling the other requests of a gevent worker.
+
+    Under gevent every request of a worker shares one OS thread, so the call is
+    handed to the hub's native thread pool. bcrypt releases the GIL, so the
+    greenlets keep running meanwhile. Outside gevent the call runs inline.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments of the call
+
+    Returns:
+        The result of the call
+    """
+    monkey = sys.modules.get("gevent.monkey")
+    if monkey is not None and monkey.is_module_patched("threading"):
+        from gevent import get_hub
+
+        return get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+
+def bcrypt_rounds() -> int:
+    """
+    Get the bcrypt work factor for new password hashes.
 
-def hash_password(password):
+    Returns:
+        The app's BCRYPT_ROUNDS setting, or DEFAULT_BCRYPT_ROUNDS outside an app
+    """
+    if has_app_context():
+        return current_app.config.get("BCRYPT_ROUNDS", DEFAULT_BCRYPT_ROUNDS)
+    return DEFAULT_BCRYPT_ROUNDS
+
+
+def hash_password(password, rounds: Optional[int] = None):
     """
     Hash a password using bcrypt.
 
     Args:
         password: Plain text password
+        rounds: bcrypt work factor, the configured one by default
 
     Returns:
         Hashed password
     """
     if isinstance(password, str):
         password = password.encode("utf-8")
-    return bcrypt.hashpw(password, bcrypt.gensalt()).decode("utf-8")
+    if rounds is None:
+        rounds = bcrypt_rounds()
+    salt = bcrypt.gensalt(rounds=rounds)
+    return _run_blocking(bcrypt.hashpw, password, salt).decode("utf-8")
+
+
+def needs_rehash(hashed_password, rounds: Optional[int] = None) -> bool:
+    """
+    Check if a hash was made with a different work factor than the configured one.
+
+    Args:
+        hashed_password: Hashed password, formatted as ``$2b$<rounds>$<salt+hash>``
+        rounds: Expected bcrypt work factor, the configured one by default
+
+    Returns:
+        True if the password should be hashed again
+    """
+    if isinstance(hashed_password, bytes):
+        hashed_password = hashed_password.decode("utf-8")
+    if rounds is None:
+        rounds = bcrypt_rounds()
+    parts = hashed_password.split("$")
+    return len(parts) < 4 or not parts[2].isdigit() or int(parts[2]) != rounds
 
 
 def check_password(password, hashed_password):
@@ -33,7 +98,7 @@ def check_password(password, hashed_password):
         password = password.encode("utf-8")
     if isinstance(hashed_password, str):
         hashed_password = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(password, hashed_password)
+    return _run_blocking(bcrypt.checkpw, password, hashed_password)
 
 
 def generate_token(user_id):
@@ -0,0 +1,22 @@
+"""SQLite helpers for the test and benchmark databases."""
+from sqlalchemy import event
+
+
+def enable_savepoints(engine):
+    """
+    Let SQLAlchemy emit BEGIN itself so pysqlite supports SAVEPOINTs.
+
+    pysqlite otherwise opens transactions on its own schedule, which breaks
+    nested transactions started with ``begin_nested``.
+
+    Args:
+        engine: Engine connected to a SQLite database
+    """
+
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
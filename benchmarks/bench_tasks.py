@@ -0,0 +1,104 @@
+"""Benchmarks for the task, tag and bulk write paths."""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import lazyload
+
+from app.models.tag import Tag
+from app.models.task import Task, TaskTag
+
+from .conftest import TASK_COUNT
+
+BULK_ROWS = 1_000
+REMOVED_TAGS = 50
+
+
+def _serialize_tasks(session, user, *options):
+    """Load every task of the user and serialize it."""
+    query = select(Task).where(Task.user_id == user.id).options(*options)
+    return [task.to_dict() for task in session.scalars(query).all()]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        pytest.param((), id="eager"),
+        pytest.param((lazyload(Task.category), lazyload(Task.task_tags)), id="lazy"),
+    ],
+)
+def bench_list_tasks_to_dict(benchmark, db_session, user, options):
+    """Serialize all tasks with the default eager loaders and with lazy loading."""
+    tasks = benchmark.pedantic(
+        _serialize_tasks,
+        args=(db_session, user, *options),
+        setup=db_session.expire_all,
+        rounds=5,
+    )
+
+    assert len(tasks) == TASK_COUNT
+
+
+def _create_tags_in_loop(session, rows):
+    """Create tags one ORM object at a time."""
+    for row in rows:
+        Tag.create(commit=False, **row)
+    session.flush()
+
+
+def _bulk_create_tags(session, rows):
+    """Create tags with a single executemany INSERT."""
+    Tag.bulk_create(rows, commit=False)
+
+
+@pytest.mark.parametrize(
+    "create", [_create_tags_in_loop, _bulk_create_tags], ids=["loop", "bulk"]
+)
+def bench_create_tags(benchmark, db_session, user, create):
+    """Insert BULK_ROWS tags through the ORM loop and through bulk_create."""
+    rows = [{"name": f"bulk{i}", "user_id": user.id} for i in range(BULK_ROWS)]
+
+    def run():
+        savepoint = db_session.begin_nested()
+        create(db_session, rows)
+        savepoint.rollback()
+
+    benchmark(run)
+
+
+def _remove_tags_individually(session, task, tags):
+    """Remove tags with a SELECT and a DELETE per association."""
+    for tag in tags:
+        task_tag = session.scalar(
+            select(TaskTag).where(TaskTag.task_id == task.id, TaskTag.tag_id == tag.id)
+        )
+        session.delete(task_tag)
+        session.flush()
+
+
+def _remove_tags_at_once(session, task, tags):
+    """Remove tags with the single DELETE used by Task.remove_tags."""
+    task.remove_tags(tags)
+
+
+@pytest.mark.parametrize(
+    "remove",
+    [_remove_tags_individually, _remove_tags_at_once],
+    ids=["select_delete", "single_delete"],
+)
+def bench_remove_tags(benchmark, db_session, user, remove):
+    """Untag REMOVED_TAGS tags from one task."""
+    task = db_session.scalars(select(Task).where(Task.user_id == user.id)).first()
+    tags = db_session.scalars(select(Tag).where(Tag.user_id == user.id)).all()
+    savepoint = db_session.begin_nested()
+    for tag in tags[:REMOVED_TAGS]:
+        if tag not in task.tags:
+            task.add_tag(tag)
+    db_session.flush()
+    tags = [task_tag.tag for task_tag in task.task_tags][:REMOVED_TAGS]
+
+    def run():
+        round_savepoint = db_session.begin_nested()
+        remove(db_session, task, tags)
+        round_savepoint.rollback()
+
+    benchmark(run)
+    savepoint.rollback()
@@ -0,0 +1,92 @@
+"""Benchmark configuration and a prepopulated database."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from app import create_app
+from app.core.config import get_settings, get_settings_mapping
+from app.core.extensions import db
+from app.models.tag import Tag
+from app.models.task import Task, TaskTag
+from app.models.user import User
+from app.utils.sqlite import enable_savepoints
+
+TASK_COUNT = 10_000
+TAG_COUNT = 100
+TAGS_PER_TASK = 3
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create the app on an in-memory SQLite database built once per run."""
+    get_settings.cache_clear()
+    get_settings_mapping.cache_clear()
+
+    app = create_app(
+        "testing", {"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:", "TESTING": True}
+    )
+
+    with app.app_context():
+        enable_savepoints(db.engine)
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture(scope="session")
+def db_session(app):
+    """Bind the session to one connection rolled back after the run.
+
+    Benchmarks wrap their writes in SAVEPOINTs so every round sees the same data.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+
+    session = scoped_session(
+        sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    )
+    app_session, db.session = db.session, session
+
+    yield session
+
+    session.remove()
+    db.session = app_session
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def user(db_session):
+    """Create a user owning TASK_COUNT tasks spread over TAG_COUNT tags."""
+    user = User(username="benchuser", email="bench@example.com", password_hash="x")
+    db_session.add(user)
+    db_session.flush()
+
+    due_date = datetime.now().date() + timedelta(days=7)
+    Tag.bulk_create(
+        [{"name": f"tag{i}", "user_id": user.id} for i in range(TAG_COUNT)],
+        commit=False,
+    )
+    Task.bulk_create(
+        [
+            {"title": f"Task {i}", "user_id": user.id, "due_date": due_date}
+            for i in range(TASK_COUNT)
+        ],
+        commit=False,
+    )
+
+    tag_ids = db_session.scalars(select(Tag.id).where(Tag.user_id == user.id)).all()
+    task_ids = db_session.scalars(select(Task.id).where(Task.user_id == user.id)).all()
+    db_session.execute(
+        insert(TaskTag),
+        [
+            {"task_id": task_id, "tag_id": tag_ids[(i + offset) % TAG_COUNT]}
+            for i, task_id in enumerate(task_ids)
+            for offset in range(TAGS_PER_TASK)
+        ],
+    )
+    db_session.expunge_all()
+    return db_session.get(User, user.id)
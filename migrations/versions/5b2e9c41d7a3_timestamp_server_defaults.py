@@ -0,0 +1,43 @@
+"""Add server defaults to timestamp columns.
+
+Revision ID: 5b2e9c41d7a3
+Revises: 0a812096264c
+Create Date: 2026-10-14 08:58:12.104257
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b2e9c41d7a3"
+down_revision = "0a812096264c"
+branch_labels = None
+depends_on = None
+
+TIMESTAMPED_TABLES = ("user", "category", "tag", "task")
+
+
+def upgrade():
+    """Let the database stamp created_at and updated_at."""
+    for table in TIMESTAMPED_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in ("created_at", "updated_at"):
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=sa.func.now(),
+                )
+
+
+def downgrade():
+    """Drop the timestamp server defaults."""
+    for table in TIMESTAMPED_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in ("created_at", "updated_at"):
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=None,
+                )
@@ -0,0 +1,65 @@
+"""Add indexes for the task, tag and category list paths.
+
+Revision ID: 8d41c2f7a9e0
+Revises: 5b2e9c41d7a3
+Create Date: 2026-10-14 09:24:41.512930
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d41c2f7a9e0"
+down_revision = "5b2e9c41d7a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create indexes."""
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_task_user_status_due", ["user_id", "status", "due_date"], unique=False
+        )
+        batch_op.create_index("ix_task_user_due", ["user_id", "due_date"], unique=False)
+        batch_op.create_index(
+            "ix_task_user_created", ["user_id", "created_at"], unique=False
+        )
+        batch_op.create_index("ix_task_category", ["category_id"], unique=False)
+        batch_op.create_index(
+            "ix_task_user_overdue",
+            ["user_id", "due_date"],
+            unique=False,
+            postgresql_where=sa.text("status <> 'READY'"),
+            sqlite_where=sa.text("status <> 'READY'"),
+        )
+
+    with op.batch_alter_table("task_tag", schema=None) as batch_op:
+        batch_op.create_index("ix_task_tag_tag_id", ["tag_id"], unique=False)
+
+    with op.batch_alter_table("tag", schema=None) as batch_op:
+        batch_op.create_index("ix_tag_user_name", ["user_id", "name"], unique=True)
+
+    with op.batch_alter_table("category", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_category_user_name", ["user_id", "name"], unique=False
+        )
+
+
+def downgrade():
+    """Drop indexes."""
+    with op.batch_alter_table("category", schema=None) as batch_op:
+        batch_op.drop_index("ix_category_user_name")
+
+    with op.batch_alter_table("tag", schema=None) as batch_op:
+        batch_op.drop_index("ix_tag_user_name")
+
+    with op.batch_alter_table("task_tag", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_tag_tag_id")
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_user_overdue")
+        batch_op.drop_index("ix_task_category")
+        batch_op.drop_index("ix_task_user_created")
+        batch_op.drop_index("ix_task_user_due")
+        batch_op.drop_index("ix_task_user_status_due")
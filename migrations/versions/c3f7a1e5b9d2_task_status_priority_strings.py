@@ -0,0 +1,118 @@
+"""Store task status and priority as CHECK-constrained strings.
+
+Revision ID: c3f7a1e5b9d2
+Revises: 8d41c2f7a9e0
+Create Date: 2026-10-14 09:31:12.204518
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3f7a1e5b9d2"
+down_revision = "8d41c2f7a9e0"
+branch_labels = None
+depends_on = None
+
+# Enum member names stored by the old columns, mapped to the stored values
+STATUS_VALUES = {"TODO": "To Do", "IN_PROGRESS": "In Progress", "READY": "Ready"}
+PRIORITY_VALUES = {"LOW": "Low", "MEDIUM": "Medium", "HIGH": "High"}
+
+status_enum = sa.Enum(*STATUS_VALUES, name="statusenum")
+priority_enum = sa.Enum(*PRIORITY_VALUES, name="priorityenum")
+
+
+def _convert(column, mapping):
+    """Rewrite a task column through a value mapping."""
+    target = sa.column(column)
+    op.execute(
+        sa.table("task", target)
+        .update()
+        .values({column: sa.case(mapping, value=target, else_=target)})
+    )
+
+
+def _values_check(column, values):
+    """Build the CHECK expression limiting a column to the given values."""
+    values = ", ".join(f"'{value}'" for value in values)
+    return f"{column} IN ({values})"
+
+
+def upgrade():
+    """Replace the enum columns with strings."""
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_user_overdue")
+        batch_op.alter_column(
+            "status",
+            existing_type=status_enum,
+            type_=sa.String(length=16),
+            existing_nullable=False,
+            postgresql_using="status::text",
+        )
+        batch_op.alter_column(
+            "priority",
+            existing_type=priority_enum,
+            type_=sa.String(length=16),
+            existing_nullable=False,
+            postgresql_using="priority::text",
+        )
+
+    _convert("status", STATUS_VALUES)
+    _convert("priority", PRIORITY_VALUES)
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.create_check_constraint(
+            "ck_task_status", _values_check("status", STATUS_VALUES.values())
+        )
+        batch_op.create_check_constraint(
+            "ck_task_priority", _values_check("priority", PRIORITY_VALUES.values())
+        )
+        batch_op.create_index(
+            "ix_task_user_overdue",
+            ["user_id", "due_date"],
+            unique=False,
+            postgresql_where=sa.text("status <> 'Ready'"),
+            sqlite_where=sa.text("status <> 'Ready'"),
+        )
+
+    bind = op.get_bind()
+    status_enum.drop(bind, checkfirst=True)
+    priority_enum.drop(bind, checkfirst=True)
+
+
+def downgrade():
+    """Restore the enum columns."""
+    bind = op.get_bind()
+    status_enum.create(bind, checkfirst=True)
+    priority_enum.create(bind, checkfirst=True)
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_user_overdue")
+        batch_op.drop_constraint("ck_task_priority", type_="check")
+        batch_op.drop_constraint("ck_task_status", type_="check")
+
+    _convert("status", {new: old for old, new in STATUS_VALUES.items()})
+    _convert("priority", {new: old for old, new in PRIORITY_VALUES.items()})
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.alter_column(
+            "priority",
+            existing_type=sa.String(length=16),
+            type_=priority_enum,
+            existing_nullable=False,
+            postgresql_using="priority::priorityenum",
+        )
+        batch_op.alter_column(
+            "status",
+            existing_type=sa.String(length=16),
+            type_=status_enum,
+            existing_nullable=False,
+            postgresql_using="status::statusenum",
+        )
+        batch_op.create_index(
+            "ix_task_user_overdue",
+            ["user_id", "due_date"],
+            unique=False,
+            postgresql_where=sa.text("status <> 'READY'"),
+            sqlite_where=sa.text("status <> 'READY'"),
+        )
@@ -0,0 +1,50 @@
+"""Maintain updated_at with a trigger on PostgreSQL.
+
+Revision ID: e6a2d8f4c1b7
+Revises: c3f7a1e5b9d2
+Create Date: 2026-10-14 09:42:37.918406
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6a2d8f4c1b7"
+down_revision = "c3f7a1e5b9d2"
+branch_labels = None
+depends_on = None
+
+TIMESTAMPED_TABLES = ("user", "category", "tag", "task")
+
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at := now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade():
+    """Create the set_updated_at function and one trigger per table."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(SET_UPDATED_AT_FUNCTION)
+    for table in TIMESTAMPED_TABLES:
+        op.execute(
+            f'CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON "{table}" '
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade():
+    """Drop the triggers and the set_updated_at function."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS trg_{table}_updated_at ON "{table}"')
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
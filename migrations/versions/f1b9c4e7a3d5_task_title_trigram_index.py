@@ -0,0 +1,33 @@
+"""Index task titles for substring search.
+
+Revision ID: f1b9c4e7a3d5
+Revises: e6a2d8f4c1b7
+Create Date: 2026-10-14 09:51:08.370215
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f1b9c4e7a3d5"
+down_revision = "e6a2d8f4c1b7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the title index, a pg_trgm GIN index on PostgreSQL."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        "ix_task_title_trgm",
+        "task",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade():
+    """Drop the title index, leaving the pg_trgm extension installed."""
+    op.drop_index("ix_task_title_trgm", table_name="task")
@@ -0,0 +1,24 @@
+"""Gevent WSGI entry point for the TasksService API."""
+# Patch the standard library before Flask and SQLAlchemy are imported
+from gevent import monkey
+
+monkey.patch_all()
+
+import logging  # noqa: E402
+import os  # noqa: E402
+
+from psycogreen.gevent import patch_psycopg  # noqa: E402
+
+# Let psycopg2 yield to other greenlets while waiting on the database
+patch_psycopg()
+
+# The log format records no thread or process details, skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+from app import create_app  # noqa: E402
+
+# Get configuration from environment
+config_name = os.getenv("FLASK_ENV", "development")
+app = create_app(config_name)